@@ -8,8 +8,8 @@ transparency, and rotation.
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSlider, 
-    QPushButton, QColorDialog, QSpinBox, QGroupBox, QGridLayout,
-    QComboBox, QDoubleSpinBox, QFrame
+    QPushButton, QColorDialog, QSpinBox, QGroupBox, QGridLayout, QFormLayout,
+    QButtonGroup, QRadioButton, QDoubleSpinBox, QFrame
 )
 from PyQt6.QtCore import pyqtSignal, Qt
 from PyQt6.QtGui import QColor, QIcon
@@ -93,6 +93,7 @@ class ZoneProperties(QWidget):
         self.setWindowFlags(Qt.WindowType.Dialog | Qt.WindowType.Window)
         self.setWindowTitle("Zone Properties")
         self.current_zone = None
+        self._loaded_state = None  # zone properties last shown in the widgets
         self._setup_ui()
         
     def _setup_ui(self):
@@ -108,58 +109,50 @@ class ZoneProperties(QWidget):
         
         # === Color and Style Group ===
         style_group = QGroupBox("Appearance")
-        style_layout = QVBoxLayout()
-        style_layout.setSpacing(20)  # More spacing between items
-        style_layout.setContentsMargins(15, 15, 15, 15)  # More space inside the group
+        form = QFormLayout()
+        form.setSpacing(20)  # More spacing between items
+        form.setContentsMargins(15, 15, 15, 15)  # More space inside the group
         
         # Color
-        color_layout = QHBoxLayout()
-        color_layout.addWidget(QLabel("Color:"))
         self.color_btn = ColorButton()
         self.color_btn.colorChanged.connect(self._on_color_changed)
-        color_layout.addWidget(self.color_btn)
-        color_layout.addStretch()
-        style_layout.addLayout(color_layout)
+        form.addRow("Color:", self.color_btn)
         
         # Width
-        width_layout = QHBoxLayout()
-        width_layout.addWidget(QLabel("Width:"))
         self.width_spin = QSpinBox()
         self.width_spin.setRange(1, 5)
         self.width_spin.setValue(1)
         self.width_spin.setFixedSize(80, 20)  # Wider width box
         self.width_spin.valueChanged.connect(self._on_width_changed)
-        width_layout.addWidget(self.width_spin)
-        width_layout.addStretch()
-        style_layout.addLayout(width_layout)
+        form.addRow("Width:", self.width_spin)
         
         # Line style
-        line_style_layout = QHBoxLayout()
-        line_style_layout.addWidget(QLabel("Line Style:"))
-        self.style_combo = QComboBox()
-        self.style_combo.addItems(["Solid", "Dashed"])
-        self.style_combo.setFixedSize(120, 20)  # Wider and taller line style box
-        self.style_combo.currentIndexChanged.connect(self._on_style_changed)
-        line_style_layout.addWidget(self.style_combo)
-        line_style_layout.addStretch()
-        style_layout.addLayout(line_style_layout)
+        line_style_row = QHBoxLayout()
+        self._solid_rb = QRadioButton("Solid")
+        self._dashed_rb = QRadioButton("Dashed")
+        self._solid_rb.setChecked(True)
+        self.style_buttons = QButtonGroup(self)
+        self.style_buttons.addButton(self._solid_rb, 0)
+        self.style_buttons.addButton(self._dashed_rb, 1)
+        self.style_buttons.idClicked.connect(self._on_style_changed)
+        line_style_row.addWidget(self._solid_rb)
+        line_style_row.addWidget(self._dashed_rb)
+        form.addRow("Line Style:", line_style_row)
 
         # Fill transparency
-        alpha_layout = QHBoxLayout()
-        alpha_layout.addWidget(QLabel("Opacity:"))
+        alpha_row = QHBoxLayout()
         self.alpha_slider = QSlider(Qt.Orientation.Horizontal)
         self.alpha_slider.setRange(0, 255)
         self.alpha_slider.setValue(0)
         self.alpha_slider.valueChanged.connect(self._on_alpha_changed)
-        alpha_layout.addWidget(self.alpha_slider)
+        alpha_row.addWidget(self.alpha_slider)
         
         self.alpha_label = QLabel("0")
         self.alpha_label.setFixedWidth(30)
-        alpha_layout.addWidget(self.alpha_label)
-        alpha_layout.addStretch()
-        style_layout.addLayout(alpha_layout)
+        alpha_row.addWidget(self.alpha_label)
+        form.addRow("Opacity:", alpha_row)
         
-        style_group.setLayout(style_layout)
+        style_group.setLayout(form)
         layout.addWidget(style_group, 2)  # Give Appearance more space (stretch factor 2)
         
         # === Rotation Group ===
@@ -241,6 +234,11 @@ class ZoneProperties(QWidget):
         zone : RectangleZoneItem | EllipseZoneItem | None
             Zone item to edit, or None to disable the panel.
         """
+        # Same zone, still showing its current values: nothing to reload.
+        # Zones can also be edited outside the panel (manager set_color/
+        # set_width), so the shown values are checked, not just the identity
+        if zone is self.current_zone and zone is not None and self._zone_state(zone) == self._loaded_state:
+            return
         self.current_zone = zone
         if zone:
             self.setEnabled(True)
@@ -248,6 +246,12 @@ class ZoneProperties(QWidget):
         else:
             self.setEnabled(False)
             
+    @staticmethod
+    def _zone_state(zone):
+        """Return the zone properties displayed by the panel, as a tuple."""
+        return (zone.zone_color, zone.zone_width, zone.zone_fill_alpha,
+                zone.get_rotation(), getattr(zone, 'zone_style', 'solid'))
+
     def _load_zone_properties(self):
         """Load properties from the current zone into the widgets."""
         if not self.current_zone:
@@ -270,7 +274,9 @@ class ZoneProperties(QWidget):
         
         # Style
         current_style = getattr(self.current_zone, 'zone_style', 'solid')
-        self.style_combo.setCurrentIndex(1 if current_style == 'dashed' else 0)
+        (self._dashed_rb if current_style == 'dashed' else self._solid_rb).setChecked(True)
+        # Read back after the widgets' own signals have written to the zone
+        self._loaded_state = self._zone_state(self.current_zone)
         
     def _on_color_changed(self, color):
         """Handle color change and update the current zone if any."""
@@ -284,10 +290,9 @@ class ZoneProperties(QWidget):
             self.current_zone.set_width(width)
         self.widthChanged.emit(width)
     
-    def _on_style_changed(self):
+    def _on_style_changed(self, idx):
         """Handle line style change and update the current zone if any."""
-        style_text = self.style_combo.currentText().lower()
-        normalized = 'dashed' if 'dash' in style_text else 'solid'
+        normalized = 'dashed' if idx == 1 else 'solid'
         if self.current_zone:
             # Call zone item method directly; managers also expose set_style when used programmatically
             if hasattr(self.current_zone, 'set_style'):
@@ -359,6 +364,7 @@ class ConeZoneProperties(QWidget):
         self.setWindowFlags(Qt.WindowType.Dialog | Qt.WindowType.Window)
         self.setWindowTitle("Cone Properties")
         self.current_zone = None
+        self._loaded_state = None  # zone properties last shown in the widgets
         self._setup_ui()
 
     # ===== UI : copie de ZoneProperties + champ Angle =====
@@ -373,59 +379,51 @@ class ConeZoneProperties(QWidget):
 
         # === Appearance (identique) ===
         style_group = QGroupBox("Appearance")
-        style_layout = QVBoxLayout()
-        style_layout.setSpacing(20)
-        style_layout.setContentsMargins(15, 15, 15, 15)
+        form = QFormLayout()
+        form.setSpacing(20)
+        form.setContentsMargins(15, 15, 15, 15)
 
         # Color
-        color_layout = QHBoxLayout()
-        color_layout.addWidget(QLabel("Color:"))
         # ColorButton est déjà utilisé par ZoneProperties
         self.color_btn = ColorButton()
         self.color_btn.colorChanged.connect(self._on_color_changed)
-        color_layout.addWidget(self.color_btn)
-        color_layout.addStretch()
-        style_layout.addLayout(color_layout)
+        form.addRow("Color:", self.color_btn)
 
         # Width
-        width_layout = QHBoxLayout()
-        width_layout.addWidget(QLabel("Width:"))
         self.width_spin = QSpinBox()
         self.width_spin.setRange(1, 5)
         self.width_spin.setValue(1)
         self.width_spin.setFixedSize(80, 20)
         self.width_spin.valueChanged.connect(self._on_width_changed)
-        width_layout.addWidget(self.width_spin)
-        width_layout.addStretch()
-        style_layout.addLayout(width_layout)
+        form.addRow("Width:", self.width_spin)
 
         # Line style
-        line_style_layout = QHBoxLayout()
-        line_style_layout.addWidget(QLabel("Line Style:"))
-        self.style_combo = QComboBox()
-        self.style_combo.addItems(["Solid", "Dashed"])
-        self.style_combo.setFixedSize(120, 20)
-        self.style_combo.currentIndexChanged.connect(self._on_style_changed)
-        line_style_layout.addWidget(self.style_combo)
-        line_style_layout.addStretch()
-        style_layout.addLayout(line_style_layout)
+        line_style_row = QHBoxLayout()
+        self._solid_rb = QRadioButton("Solid")
+        self._dashed_rb = QRadioButton("Dashed")
+        self._solid_rb.setChecked(True)
+        self.style_buttons = QButtonGroup(self)
+        self.style_buttons.addButton(self._solid_rb, 0)
+        self.style_buttons.addButton(self._dashed_rb, 1)
+        self.style_buttons.idClicked.connect(self._on_style_changed)
+        line_style_row.addWidget(self._solid_rb)
+        line_style_row.addWidget(self._dashed_rb)
+        form.addRow("Line Style:", line_style_row)
 
         # Fill transparency
-        alpha_layout = QHBoxLayout()
-        alpha_layout.addWidget(QLabel("Opacity:"))
+        alpha_row = QHBoxLayout()
         self.alpha_slider = QSlider(Qt.Orientation.Horizontal)
         self.alpha_slider.setRange(0, 255)
         self.alpha_slider.setValue(0)
         self.alpha_slider.valueChanged.connect(self._on_alpha_changed)
-        alpha_layout.addWidget(self.alpha_slider)
+        alpha_row.addWidget(self.alpha_slider)
 
         self.alpha_label = QLabel("0")
         self.alpha_label.setFixedWidth(30)
-        alpha_layout.addWidget(self.alpha_label)
-        alpha_layout.addStretch()
-        style_layout.addLayout(alpha_layout)
+        alpha_row.addWidget(self.alpha_label)
+        form.addRow("Opacity:", alpha_row)
 
-        style_group.setLayout(style_layout)
+        style_group.setLayout(form)
         layout.addWidget(style_group, 2)
 
         # === Rotation (identique) + Interior angle (nouveau) ===
@@ -514,6 +512,11 @@ class ConeZoneProperties(QWidget):
         zone : RectangleZoneItem | EllipseZoneItem | None
             Zone item to edit, or None to disable the panel.
         """
+        # Same zone, still showing its current values: nothing to reload.
+        # Zones can also be edited outside the panel (manager set_color/
+        # set_width), so the shown values are checked, not just the identity
+        if zone is self.current_zone and zone is not None and self._zone_state(zone) == self._loaded_state:
+            return
         self.current_zone = zone
         if zone:
             self.setEnabled(True)
@@ -521,6 +524,12 @@ class ConeZoneProperties(QWidget):
         else:
             self.setEnabled(False)
             
+    @staticmethod
+    def _zone_state(zone):
+        """Return the zone properties displayed by the panel, as a tuple."""
+        return (zone.zone_color, zone.zone_width, zone.zone_fill_alpha,
+                zone.get_rotation(), getattr(zone, 'zone_style', 'solid'))
+
     def _load_zone_properties(self):
         """Load properties from the current zone into the widgets."""
         if not self.current_zone:
@@ -543,7 +552,9 @@ class ConeZoneProperties(QWidget):
         
         # Style
         current_style = getattr(self.current_zone, 'zone_style', 'solid')
-        self.style_combo.setCurrentIndex(1 if current_style == 'dashed' else 0)
+        (self._dashed_rb if current_style == 'dashed' else self._solid_rb).setChecked(True)
+        # Read back after the widgets' own signals have written to the zone
+        self._loaded_state = self._zone_state(self.current_zone)
         
     def _on_color_changed(self, color):
         """Handle color change and update the current zone if any."""
@@ -557,10 +568,9 @@ class ConeZoneProperties(QWidget):
             self.current_zone.set_width(width)
         self.widthChanged.emit(width)
     
-    def _on_style_changed(self):
+    def _on_style_changed(self, idx):
         """Handle line style change and update the current zone if any."""
-        style_text = self.style_combo.currentText().lower()
-        normalized = 'dashed' if 'dash' in style_text else 'solid'
+        normalized = 'dashed' if idx == 1 else 'solid'
         if self.current_zone:
             # Call zone item method directly; managers also expose set_style when used programmatically
             if hasattr(self.current_zone, 'set_style'):
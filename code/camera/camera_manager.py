@@ -6,6 +6,7 @@ Handles zoom, panning, camera presets (full, ball-follow, corners, penalties),
 and smooth updates while following the ball.
 """
 
+import math
 import numpy as np
 from PyQt6.QtCore import QTimer, QRectF, QPointF, Qt
 from PyQt6.QtWidgets import QGraphicsView
@@ -328,8 +329,8 @@ class CameraManager:
         current_center = self.view.mapToScene(self.view.rect().center())
         target_center = QPointF(self.current_ball_pos[0], self.current_ball_pos[1])
         
-        distance = np.sqrt((current_center.x() - target_center.x())**2 + 
-                          (current_center.y() - target_center.y())**2)
+        distance = math.hypot(current_center.x() - target_center.x(),
+                              current_center.y() - target_center.y())
         
         if distance > 1.5:
             new_center = QPointF(
@@ -13,6 +13,7 @@ Only metadata and constants are defined here; no runtime logic.
 """
 
 from PyQt6.QtCore import Qt
+from typing import Final
 import os
 
 # Paths / Loading
@@ -27,28 +28,28 @@ FILE_NAME_INFOS = f"DFL_02_01_matchinformation_DFL-COM-000001_DFL-MAT-{MATCH_ID}
 FILE_NAME_EVENTS = f"DFL_03_02_events_raw_DFL-COM-000001_DFL-MAT-{MATCH_ID}.xml"
 
 # Panel size
-LEFT_PANEL_SIZE = 1200  
+LEFT_PANEL_SIZE: Final[int] = 1200  
 
 
 # Display
-SCENE_EXTRA_GRASS = 48
-LINE_WIDTH = 0.25
+SCENE_EXTRA_GRASS: Final[int] = 48
+LINE_WIDTH: Final[float] = 0.25
 
 # Zones
-GOAL_DEPTH = 2.44
-GOAL_WIDTH = 7.32
-PENALTY_AREA_LENGTH = 16.5
-PENALTY_AREA_WIDTH = 40.3
-GOAL_AREA_LENGTH = 5.5
-GOAL_AREA_WIDTH = 18.32
-CENTER_CIRCLE_RADIUS = 9.15
-POINT_RADIUS = 0.5
-PENALTY_SPOT_DIST = 11
+GOAL_DEPTH: Final[float] = 2.44
+GOAL_WIDTH: Final[float] = 7.32
+PENALTY_AREA_LENGTH: Final[float] = 16.5
+PENALTY_AREA_WIDTH: Final[float] = 40.3
+GOAL_AREA_LENGTH: Final[float] = 5.5
+GOAL_AREA_WIDTH: Final[float] = 18.32
+CENTER_CIRCLE_RADIUS: Final[float] = 9.15
+POINT_RADIUS: Final[float] = 0.5
+PENALTY_SPOT_DIST: Final[int] = 11
 
 
 
 # ===== Base values (unscaled) =====
-PLAYER_OUTER_RADIUS_BASE = 1.6  # reference value when scale = 1.0
+PLAYER_OUTER_RADIUS_BASE: Final[float] = 1.6  # reference value when scale = 1.0
  
 # The following values become properties depending on the scale
 class DynamicConfig:
@@ -143,41 +144,46 @@ def get_offside_line_width():
     return CONFIG.OFFSIDE_LINE_WIDTH
 
 # Static values (do not change with scale)
-PLAYER_ROTATION_OFFSET_DEG = 270
-PLAYER_ROTATION_DEFAULT_DEG = 90
-PLAYER_CHEVRON_ANGLE_DEG = 150
-VELOCITY_ARROW_SCALE = 1
+PLAYER_ROTATION_OFFSET_DEG: Final[int] = 270
+PLAYER_ROTATION_DEFAULT_DEG: Final[int] = 90
+PLAYER_CHEVRON_ANGLE_DEG: Final[int] = 150
+VELOCITY_ARROW_SCALE: Final[int] = 1
 BALL_COLOR = "#FFA500"
 
 # Annotation_tools constants
-ANNOTATION_ARROW_HEAD_LENGTH = 2
-ANNOTATION_ARROW_HEAD_ANGLE = 30
-ANNOTATION_ARROW_BASE_WIDTH_VALUE = 1
+ANNOTATION_ARROW_HEAD_LENGTH: Final[int] = 2
+ANNOTATION_ARROW_HEAD_ANGLE: Final[int] = 30
+ANNOTATION_ARROW_BASE_WIDTH_VALUE: Final[int] = 1
 ANNOTATION_ARROW_SCALE_RANGE = (ANNOTATION_ARROW_BASE_WIDTH_VALUE, ANNOTATION_ARROW_BASE_WIDTH_VALUE * 10)
 
 # ---- Timeline and UI ----
-MAX_TIMELINE_WIDTH = 550
-MIN_TIMELINE_WIDTH = 350
-EXTRA_TIMELINE_PADDING = 60
-TIMELINE_SLIDER_HEIGHT = 24
-TIMELINE_GROOVE_HEIGHT = TIMELINE_SLIDER_HEIGHT - TIMELINE_SLIDER_HEIGHT//3
-TIMELINE_HANDLE_WIDTH = TIMELINE_GROOVE_HEIGHT // 2
-TIMELINE_HANDLE_HEIGHT = TIMELINE_GROOVE_HEIGHT + TIMELINE_GROOVE_HEIGHT//2
-NAV_BUTTON_WIDTH = 35
-NAV_BUTTON_HEIGHT = 30
+MAX_TIMELINE_WIDTH: Final[int] = 550
+MIN_TIMELINE_WIDTH: Final[int] = 350
+EXTRA_TIMELINE_PADDING: Final[int] = 60
+TIMELINE_SLIDER_HEIGHT: Final[int] = 24
+TIMELINE_GROOVE_HEIGHT: Final[int] = TIMELINE_SLIDER_HEIGHT - TIMELINE_SLIDER_HEIGHT//3
+TIMELINE_HANDLE_WIDTH: Final[int] = TIMELINE_GROOVE_HEIGHT // 2
+TIMELINE_HANDLE_HEIGHT: Final[int] = TIMELINE_GROOVE_HEIGHT + TIMELINE_GROOVE_HEIGHT//2
+NAV_BUTTON_WIDTH: Final[int] = 35
+NAV_BUTTON_HEIGHT: Final[int] = 30
 
 # time
-FPS = 25
-LENGTH_FIRST_HALF = 45
-LENGTH_SECOND_HALF = 45
-LENGTH_OVERTIME_HALF = 15
-LENGTH_FULL_TIME = LENGTH_FIRST_HALF + LENGTH_SECOND_HALF
-LENGTH_EXTRA_TIME = 2 * LENGTH_OVERTIME_HALF
+FPS: Final[int] = 25
+LENGTH_FIRST_HALF: Final[int] = 45
+LENGTH_SECOND_HALF: Final[int] = 45
+LENGTH_OVERTIME_HALF: Final[int] = 15
+LENGTH_FULL_TIME: Final[int] = LENGTH_FIRST_HALF + LENGTH_SECOND_HALF
+LENGTH_EXTRA_TIME: Final[int] = 2 * LENGTH_OVERTIME_HALF
+
+# Playback: when rendering is slower than the timer, frames are skipped
+PLAYBACK_MAX_FRAME_STEP: Final[int] = 8        # Upper bound on frames advanced per tick
+PLAYBACK_RENDER_EMA_ALPHA: Final[float] = 0.2  # Smoothing of the measured render time
 
 # Players and ball trajectories
 TRAJECTORY_STYLE = Qt.PenStyle.DotLine
-TRAJECTORY_SAMPLE_RATE = 5
+TRAJECTORY_SAMPLE_RATE: Final[int] = 10  # Frames between trajectory points, computed and drawn
 TRAJECTORY_FADING = True  # Set to False to disable progressive fading of trajectories
+TRAJECTORY_ALPHA_LEVELS: Final[int] = 10  # Faded segments are batched into one path per opacity level
 
 # Simulation preview mode: when True, only display user-drawn arrows (team-colored)
 # without computing or drawing simulated/future trajectories
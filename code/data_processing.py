@@ -381,45 +381,33 @@ def build_ball_carrier_array(
     else:
         possession_flat = np.array(possession)
 
-    # Get XY arrays for all players and the ball
-    player_xy = {}
-    for side, ids in [('Home', home_ids), ('Away', away_ids)]:
-        arr = np.vstack([
-            xy_objects['firstHalf'][side].xy,
-            xy_objects['secondHalf'][side].xy
-        ])
-        for j, pid in enumerate(ids):
-            player_xy[pid] = arr[:, 2*j:2*j+2]
     ball_xy = np.vstack([
         xy_objects['firstHalf']['Ball'].xy,
         xy_objects['secondHalf']['Ball'].xy
-    ])
-
-    frame_carrier = []
-    for i in range(n_frames):
-        poss = possession_flat[i]
-        if poss == 1:
-            ids, side = home_ids, "Home"
-        elif poss == 2:
-            ids, side = away_ids, "Away"
-        else:
-            frame_carrier.append((None, None))
-            continue
+    ])[:n_frames]
 
-        bx, by = ball_xy[i]
-        min_dist = np.inf
-        pid_proche = None
-        for pid in ids:
-            px, py = player_xy[pid][i]
-            dist = np.sqrt((bx - px)**2 + (by - py)**2)
-            if dist < min_dist:
-                min_dist = dist
-                pid_proche = pid
+    frame_carrier = [(None, None)] * n_frames
+    for code, side, ids in [(1, 'Home', home_ids), (2, 'Away', away_ids)]:
+        frames = np.flatnonzero(possession_flat[:n_frames] == code)
+        if len(frames) == 0 or not ids:
+            continue
+        # (frames, players, 2) positions of the team in possession
+        arr = np.vstack([
+            xy_objects['firstHalf'][side].xy,
+            xy_objects['secondHalf'][side].xy
+        ])
+        xy = arr[frames, :2*len(ids)].reshape(len(frames), len(ids), 2)
+        bx = ball_xy[frames, 0, None]
+        by = ball_xy[frames, 1, None]
+        d2 = (xy[..., 0] - bx)**2 + (xy[..., 1] - by)**2
+        d2[np.isnan(d2)] = np.inf
+        # Closest player per frame (first one on ties)
+        nearest = np.argmin(d2, axis=1)
+        best = d2[np.arange(len(frames)), nearest]
         # If too far, there is no ball carrier
-        if pid_proche is not None and min_dist < distance_threshold:
-            frame_carrier.append((pid_proche, side))
-        else:
-            frame_carrier.append((None, None))
+        close = best < distance_threshold**2
+        for i, j in zip(frames[close].tolist(), nearest[close].tolist()):
+            frame_carrier[i] = (ids[j], side)
     return frame_carrier
 
 
@@ -448,6 +436,57 @@ def get_pressure_color(pressure):
 
 
 
+def _pressure_core(px, py, xs, ys, v, a_mag, angle, t_threshold, sigma):
+    """Combine defender pressing probabilities into one pressure intensity.
+
+    Parameters
+    ----------
+    px, py : float
+        Ball carrier position.
+    xs, ys, v, a_mag, angle : numpy.ndarray
+        Per-defender position, speed (m/s), acceleration magnitude and
+        heading (radians); NaN marks missing values.
+    t_threshold : float
+        Time threshold for pressing probability (s).
+    sigma : float
+        Sigmoid width for probability mapping.
+
+    Returns
+    -------
+    float
+        Pressure intensity in [0, 1].
+    """
+    dx, dy = px - xs, py - ys
+    dist = np.hypot(dx, dy)
+    placed = ~(np.isnan(xs) | np.isnan(ys))
+    # Defender on the carrier: avoid the zero-division, full pressure
+    contact = placed & (dist <= 1e-6)
+    # Defenders with missing kinematic inputs do not press
+    moving = placed & ~contact & ~(np.isnan(v) | np.isnan(a_mag) | np.isnan(angle))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Project speed and acceleration (assumed along heading) onto the line to the carrier
+        heading = np.cos(angle) * (dx / dist) + np.sin(angle) * (dy / dist)
+        v0 = v * heading
+        a_par = a_mag * heading
+
+        # Solve 0.5*a*t^2 + v0*t - dist = 0 (constant acceleration along the line)
+        tti_linear = dist / np.where(v0 > 0, v0, 1e-6)
+        disc = v0*v0 + 2.0 * a_par * dist
+        root = (-v0 + np.sqrt(np.maximum(disc, 0.0))) / a_par
+        tti = np.where(
+            np.abs(a_par) < 1e-9, tti_linear,
+            np.where(disc >= 0, np.where(root <= 0, tti_linear, root), dist / (np.abs(v0) + 1e-6))
+        )
+
+    proba = np.zeros(len(xs))
+    proba[moving] = expit((t_threshold - tti[moving]) / sigma)
+    proba[contact] = 1.0
+    # Global pressure (complement of joint non-pressures)
+    intensity = 1 - np.prod(1 - proba)
+    return float(np.clip(intensity, 0, 1))
+
+
 def compute_pressure(
     ball_xy,              # tuple (x, y) of the ball at current frame
     carrier_pid,          # id of the ball carrier at current frame
@@ -461,74 +500,48 @@ def compute_pressure(
     idx,                  # index of current frame within the half
     t_threshold=1.2,      # time threshold for pressing probability (s)
     sigma=0.5,           # sigmoid width for probability mapping
+    pid_index=None,       # optional {side: {player_id: column}} lookup
 ):
     """
     Compute defensive pressure around the ball carrier at the given frame.
+
+    Gathers per-defender inputs into arrays and delegates the math to
+    `_pressure_core`.
     """
    # --- Carrier position
+    defenders_ids = home_ids if carrier_side == "Away" else away_ids
+    if pid_index is None:
+        pid_index = {
+            "Home": {pid: i for i, pid in enumerate(home_ids)},
+            "Away": {pid: i for i, pid in enumerate(away_ids)},
+        }
     try:
-        defenders_ids = home_ids if carrier_side == "Away" else away_ids
-        carrier_team_ids = home_ids if carrier_side == "Home" else away_ids
         xy = xy_objects[half][carrier_side].xy[idx]
-        i = carrier_team_ids.index(carrier_pid)
+        i = pid_index[carrier_side][carrier_pid]
         px, py = xy[2*i], xy[2*i+1]
     except Exception as e:
         px, py = ball_xy
 
-    # Defenders list (opposite team of the carrier)
-    res = []
-    for pid in defenders_ids:
+    # Defenders (opposite team of the carrier); unreadable entries stay NaN
+    n = len(defenders_ids)
+    xs, ys = np.full(n, np.nan), np.full(n, np.nan)
+    v, a_mag, angle = np.full(n, np.nan), np.full(n, np.nan), np.full(n, np.nan)
+    side = "Home" if carrier_side == "Away" else "Away"
+    try:
+        xy = xy_objects[half][side].xy[idx]
+        ids = xy_objects[half][side].ids if hasattr(xy_objects[half][side], 'ids') else defenders_ids
+    except Exception:
+        xy, ids = None, defenders_ids
+    for k, pid in enumerate(defenders_ids):
         try:
-            side = "Home" if carrier_side == "Away" else "Away"
-            xy = xy_objects[half][side].xy[idx]
-            ids = xy_objects[half][side].ids if hasattr(xy_objects[half][side], 'ids') else defenders_ids
-            i = ids.index(pid)
-            x, y = xy[2*i], xy[2*i+1]
-
-            if np.isnan(x) or np.isnan(y):
-                res.append(0)
-                continue
-
-            # Distance and unit vector from defender to carrier
-            dx, dy = (px - x), (py - y)
-            dist = float(np.hypot(dx, dy))
-            if dist <= 1e-6: # if the defender is at the same position as the carrier, we want to avoid "zero-division"
-                res.append(1.0)
-                continue
-            ux, uy = dx / dist, dy / dist
-
-            # Kinematics along the line to carrier
-            v = float(dsam[side][pid][half]["S"][idx])  # m/s
-            a_mag = dsam[side][pid][half]["A"][idx]
-            # Skip defender if kinematic inputs are missing
-            if np.isnan(v) or np.isnan(a_mag) or np.isnan(orientations[pid][idx]):
-                continue
-            angle = float(orientations[pid][idx]) if pid in orientations and len(orientations[pid]) > idx else 0.0
-
-            # Defender heading unit vector
-            hx, hy = np.cos(angle), np.sin(angle)
-
-            # Project speed and acceleration onto the line to the carrier
-            v0 = v * (hx * ux + hy * uy)  # m/s along (def -> carrier)
-            a_par = a_mag * (hx * ux + hy * uy)  # assume accel along heading
-
-            # Solve 0.5*a*t^2 + v0*t - dist = 0 (constant acceleration along the line)
-            if abs(a_par) < 1e-9:
-                v_eff = v0 if v0 > 0 else 1e-6
-                tti = dist / v_eff
-            else:
-                disc = v0*v0 + 2.0 * a_par * dist
-                if disc >= 0:
-                    tti = (-v0 + np.sqrt(disc)) / a_par
-                    if tti <= 0:
-                        tti = dist / (v0 if v0 > 0 else 1e-6)
-                else:
-                    tti = dist / (abs(v0) + 1e-6)
-
-            proba = float(expit((t_threshold - tti) / sigma))
-            res.append(proba)
+            i = k if ids is defenders_ids else ids.index(pid)
+            xs[k], ys[k] = xy[2*i], xy[2*i+1]
         except Exception:
-            res.append(0)
-    # Global pressure (complement of joint non-pressures)
-    intensity = 1 - np.prod(1 - np.array(res))
-    return float(np.clip(intensity, 0, 1))
\ No newline at end of file
+            continue
+        try:
+            v[k] = dsam[side][pid][half]["S"][idx]  # m/s
+            a_mag[k] = dsam[side][pid][half]["A"][idx]
+            angle[k] = orientations[pid][idx]
+        except Exception:
+            v[k] = np.nan
+    return _pressure_core(float(px), float(py), xs, ys, v, a_mag, angle, t_threshold, sigma)
\ No newline at end of file
@@ -7,6 +7,9 @@ annotations, tactical simulation, camera controls, and theme/settings.
 """
 import os
 import sys
+import math
+import time
+from functools import lru_cache
 import numpy as np
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QSlider, QPushButton,
@@ -17,25 +20,19 @@ from PyQt6.QtCore import QTimer, QEvent, QDir, QSize, QRect, QRectF, Qt
 from PyQt6.QtGui import QColor, QIcon, QFont, QAction
 
 # Local imports
-from pitch import PitchWidget
-from annotation.annotation import ArrowAnnotationManager, RectangleZoneManager, EllipseZoneManager, ConeZoneManager
-from annotation.arrow.arrow_properties import ArrowProperties
-from annotation.zone_properties import ZoneProperties, ConeZoneProperties
+from pitch import PitchWidget, PLAYER_RECORD_DTYPE
 from data_processing import load_data, extract_match_actions_from_events, format_match_time, compute_pressure
 from trajectory import TrajectoryManager
 from match_actions import ActionFilterBar, create_nav_button
-from utils.frame_utils import FrameManager, PossessionTracker
+from utils.frame_utils import FrameManager
 from slider import TimelineWidget
 from score_manager import ScoreManager
-from tactical_simulation import TacticalSimulationManager
 from theme_manager import ThemeManager, majority_light
 from camera.camera_manager import CameraManager  
 from camera.camera_controls import CameraControlWidget
 from settings import SettingsManager, SettingsDialog
 from config import *
 
-import qt_material
-
 
 # ===== Centralized data loading =====
 data = load_data(
@@ -65,12 +62,97 @@ id2num             = data['id2num']
 n_frames_firstHalf = data['n1']
 n_frames_secondHalf= data['n2']
 n_frames           = data['ntot']
-last_positions     = {'Home': {pid: (np.nan, np.nan) for pid in home_ids}, 'Away': {pid: (np.nan, np.nan) for pid in away_ids}, 'Ball': (np.nan, np.nan)}
+# Integer player indexing: column of player i is 2*i (X) / 2*i+1 (Y) in the xy arrays
+HOME_NUM           = len(home_ids)
+AWAY_NUM           = len(away_ids)
+HOME_PID_IDX       = {pid: i for i, pid in enumerate(home_ids)}
+AWAY_PID_IDX       = {pid: i for i, pid in enumerate(away_ids)}
+PID_IDX            = {"Home": HOME_PID_IDX, "Away": AWAY_PID_IDX}
 
 X_MIN, X_MAX = pitch_info.xlim
 Y_MIN, Y_MAX = pitch_info.ylim
 
 
+def _build_players_data(ids, colors_by_id, default_colors):
+    """Build player display data for the arrow player selection widgets.
+
+    Parameters
+    ----------
+    ids : list[str]
+        Player IDs of one team.
+    colors_by_id : dict
+        Player ID → [main, secondary, number] colors.
+    default_colors : list[str]
+        Colors used for players missing from `colors_by_id`.
+
+    Returns
+    -------
+    dict[str, tuple[str, str, str, str]]
+        Player ID → (number, main_color, sec_color, num_color).
+    """
+    players = {}
+    for player_id in ids:
+        number = id2num.get(player_id, "?")
+        colors = colors_by_id.get(player_id, default_colors)
+        main_color = colors[0]
+        sec_color = colors[1] if len(colors) > 1 else colors[0]
+        num_color = colors[2] if len(colors) > 2 else "#000000"
+        players[player_id] = (number, main_color, sec_color, num_color)
+    return players
+
+# Player display data is fixed for the match: build once, shared by all selection widgets
+HOME_PLAYERS_DATA = _build_players_data(home_ids, home_colors, ["#FF0000", "#FFFFFF", "#000000"])
+AWAY_PLAYERS_DATA = _build_players_data(away_ids, away_colors, ["#0000FF", "#FFFFFF", "#000000"])
+
+def _stack_series(series):
+    """Stack per-player 1-D series into one NaN-padded 2-D array.
+
+    Parameters
+    ----------
+    series : list[array-like]
+        One series per player; lengths may differ.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        (n_players, max_len) float array, padded with NaN, and the length
+        of each player's series.
+    """
+    lengths = np.array([len(s) for s in series], dtype=np.intp)
+    stack = np.full((len(series), lengths.max(initial=0)), np.nan)
+    for row, s in enumerate(series):
+        stack[row, :len(s)] = s
+    return stack, lengths
+
+# Per-player orientation (global frame) and speed (half frame) stacks, rows ordered like home_ids/away_ids;
+# the *_LEN arrays hold each player's series length (shorter series are NaN-padded)
+ORIENT_STACK, ORIENT_LEN = {}, {}
+SPEED_STACK, SPEED_LEN = {}, {}
+for _side, _ids in (("Home", home_ids), ("Away", away_ids)):
+    ORIENT_STACK[_side], ORIENT_LEN[_side] = _stack_series([player_orientations[pid] for pid in _ids])
+    for _half in ("firstHalf", "secondHalf"):
+        SPEED_STACK[(_side, _half)], SPEED_LEN[(_side, _half)] = _stack_series(
+            [dsam[_side][pid][_half]['S'] for pid in _ids]
+        )
+
+# Per-player display attributes as struct-of-arrays, rows ordered like home_ids/away_ids
+PLAYER_SOA = {
+    side: {
+        'main': np.array([colors[pid][0] for pid in ids], dtype='U9'),
+        'sec': np.array([colors[pid][1] for pid in ids], dtype='U9'),
+        'numc': np.array([colors[pid][2] for pid in ids], dtype='U9'),
+        'number': np.array([str(id2num.get(pid, "")) for pid in ids], dtype='U4'),
+        'z': z_base + np.arange(len(ids), dtype=np.int32),
+    }
+    for side, ids, colors, z_base in (("Home", home_ids, home_colors, 10), ("Away", away_ids, away_colors, 50))
+}
+
+# Score label colors and background brightness, fixed for the match
+HOME_MAIN_COLOR, HOME_SEC_COLOR = home_colors[home_ids[0]][0], home_colors[home_ids[0]][1]
+AWAY_MAIN_COLOR, AWAY_SEC_COLOR = away_colors[away_ids[0]][0], away_colors[away_ids[0]][1]
+SCORE_DARK_BG = majority_light([HOME_MAIN_COLOR, AWAY_MAIN_COLOR, HOME_SEC_COLOR, AWAY_SEC_COLOR])
+
+
 def get_frame_data(frame_number):
     """Map a global frame index to half-relative info.
 
@@ -90,6 +172,22 @@ def get_frame_data(frame_number):
     else:
         return "secondHalf", frame_number - n_frames_firstHalf, "2nd Half"
 
+@lru_cache(maxsize=None)
+def get_match_time(frame_number):
+    """Return the match time string for a global frame (memoized per frame).
+
+    Parameters
+    ----------
+    frame_number : int
+        Global frame index in [0, n_frames).
+
+    Returns
+    -------
+    str
+        Formatted match time, as produced by `format_match_time`.
+    """
+    return format_match_time(frame_number, n_frames_firstHalf, n_frames_secondHalf, 0, 0, fps=FPS)
+
 def get_possession_for_frame(possession, half, frame_idx):
     """Return possession team for a half-relative frame.
 
@@ -146,32 +244,19 @@ def _detect_home_side_first_half(xy_objects, home_ids, away_ids):
     n_frames = min(len(xy_home), len(xy_away))
     if n_frames <= 0:
         return 'left'
-    n_use = 50
-    home_meds = []
-    away_meds = []
-    for f in range(n_use):
-        xs_home = []
-        xs_away = []
-        xh = xy_home[f]; xa = xy_away[f]
-        for i, _pid in enumerate(home_ids):
-            x = xh[2*i]
-            if not np.isnan(x):
-                xs_home.append(x)
-        for i, _pid in enumerate(away_ids):
-            x = xa[2*i]
-            if not np.isnan(x):
-                xs_away.append(x)
-        if xs_home:
-            home_meds.append(float(np.median(xs_home)))
-        if xs_away:
-            away_meds.append(float(np.median(xs_away)))
-    if not home_meds or not away_meds:
+    n_use = min(50, n_frames)
+    # X columns only, restricted to the listed players (small float32 scratch blocks)
+    xs_home = np.asarray(xy_home[:n_use], dtype=np.float32)[:, 0:2*len(home_ids):2]
+    xs_away = np.asarray(xy_away[:n_use], dtype=np.float32)[:, 0:2*len(away_ids):2]
+    with np.errstate(all='ignore'):
+        # All-NaN rows yield NaN medians, ignored by nanmean
+        home_avg = float(np.nanmean(np.nanmedian(xs_home, axis=1))) if xs_home.size else np.nan
+        away_avg = float(np.nanmean(np.nanmedian(xs_away, axis=1))) if xs_away.size else np.nan
+    if np.isnan(home_avg) or np.isnan(away_avg):
         # Fallback to center split if something went wrong
         center_x = (X_MIN + X_MAX) / 2.0
-        mean_home = np.nanmean([xy_home[0][2*i] for i, _ in enumerate(home_ids)])
+        mean_home = np.nanmean(xy_home[0][0:2*len(home_ids):2])
         return 'left' if mean_home < center_x else 'right'
-    home_avg = float(np.mean(home_meds))
-    away_avg = float(np.mean(away_meds))
     return 'left' if home_avg < away_avg else 'right'
 
 # Precompute team sides per half
@@ -182,55 +267,73 @@ _SIDES_BY_HALF = {
     'secondHalf': {'Home': _HOME_SIDE_SECOND, 'Away': ('right' if _HOME_SIDE_SECOND == 'left' else 'left')},
 }
 
-def get_offside_line_x(xy_objects, half, frame_idx, possession_team, home_ids, away_ids, teams_df, last_positions):
-    """Compute offside line X based on second-last defender toward own goal.
+# Same sides as int codes, indexed by [half_idx, team_idx] (half: 0 first / 1 second, team: 0 Home / 1 Away)
+_SIDE_LEFT, _SIDE_RIGHT = 0, 1
+_SIDES_TBL = np.array(
+    [[_SIDE_LEFT if _SIDES_BY_HALF[half][team] == 'left' else _SIDE_RIGHT for team in ('Home', 'Away')]
+     for half in ('firstHalf', 'secondHalf')],
+    dtype=np.int8,
+)
+
+# Whole-match arrays (first half followed by second half) for per-frame lookups
+xy_home_flat = np.concatenate([xy_objects['firstHalf']['Home'].xy, xy_objects['secondHalf']['Home'].xy]).astype(np.float32)
+xy_away_flat = np.concatenate([xy_objects['firstHalf']['Away'].xy, xy_objects['secondHalf']['Away'].xy]).astype(np.float32)
+poss_codes = np.concatenate([possession['firstHalf'].code, possession['secondHalf'].code]).astype(np.int8)
+
+def _build_offside_table():
+    """Precompute the offside line X for every global frame.
+
+    Defending team per frame follows the possession codes (Away defends
+    unless Away is in possession), and sides follow `_SIDES_TBL`.
+
+    Returns
+    -------
+    numpy.ndarray
+        float32 array of shape (n_frames,), NaN where no line is available.
+    """
+    offside_x = np.full(n_frames, np.nan, dtype=np.float32)
+    for team_idx, team, xy_flat, n_players in ((0, "Home", xy_home_flat, HOME_NUM),
+                                               (1, "Away", xy_away_flat, AWAY_NUM)):
+        # Players without tracking data (NaN X) are left out of the ranking
+        xs = xy_flat[:, 0:2*n_players:2]
+        valid = ~np.isnan(xs)
+        n_valid = np.count_nonzero(valid, axis=1)
+        defends = (poss_codes == 2) if team == "Home" else (poss_codes != 2)
+        for half_idx, sl in ((0, slice(0, n_frames_firstHalf)),
+                             (1, slice(n_frames_firstHalf, n_frames))):
+            nv = n_valid[sl]
+            # Missing players become +inf so they never rank among the two extremes
+            if _SIDES_TBL[half_idx, team_idx] == _SIDE_LEFT:
+                # Two smallest X per frame
+                extremes = np.partition(np.where(valid[sl], xs[sl], np.inf), 1, axis=1)
+            else:
+                # Two largest X per frame (partition on negated values)
+                extremes = -np.partition(np.where(valid[sl], -xs[sl], np.inf), 1, axis=1)
+            # 2nd defender, or the only one
+            chosen = np.where(nv >= 2, extremes[:, 1], extremes[:, 0])
+            chosen[nv == 0] = np.nan
+            mask = defends[sl]
+            offside_x[sl][mask] = chosen[mask]
+    return offside_x
+
+_OFFSIDE_X = _build_offside_table()
+
+def compute_frame_features(frame_number):
+    """Look up possession and offside line for a global frame.
 
     Parameters
     ----------
-    xy_objects : dict
-        Positions per half and side.
-    half : {'firstHalf','secondHalf'}
-    frame_idx : int
-        Index within the half.
-    possession_team : str | None
-        Team in possession ("Home"/"Away"). Determines defending side.
-    home_ids, away_ids : list[str]
-    teams_df : pandas.DataFrame
-        Unused here (kept for compatibility).
-    last_positions : dict
-        Fallback last-known X per player if current X is NaN.
+    frame_number : int
+        Global frame index in [0, n_frames).
 
     Returns
     -------
-    float | None
-        X coordinate for the offside line, or None if unavailable.
+    tuple[int, float | None]
+        (possession_code, offside_x) where possession_code is 0 none, 1 Home,
+        2 Away, and offside_x is None if unavailable.
     """
-    defending_team = "Home" if possession_team == "Away" else "Away"
-    player_ids_team = home_ids if defending_team == "Home" else away_ids
-    # Which side this defending team occupies in this half
-    defending_side = _SIDES_BY_HALF.get(half, {}).get(defending_team, 'left')
-
-    # Get X for all 11 defending players (including GK)
-    xy = xy_objects[half][defending_team].xy[frame_idx]
-    x_coords = []
-    for i, pid in enumerate(player_ids_team):
-        x = xy[2*i]
-        if np.isnan(x):
-            x = last_positions[defending_team].get(pid, (np.nan, np.nan))[0]
-        if not np.isnan(x):
-            x_coords.append(x)
-
-    if not x_coords:
-        return None
-    # Sort positions and choose second defender toward own goal line
-    xs_sorted = sorted(x_coords)
-    if defending_side == 'left':
-        # Own goal on the left → smaller X are nearer own goal → take 2nd smallest
-        chosen = xs_sorted[1] if len(xs_sorted) >= 2 else xs_sorted[0]
-    else:
-        # Own goal on the right → larger X are nearer own goal → take 2nd largest
-        chosen = xs_sorted[-2] if len(xs_sorted) >= 2 else xs_sorted[-1]
-    return chosen
+    offside_x = _OFFSIDE_X[frame_number]
+    return int(poss_codes[frame_number]), (None if np.isnan(offside_x) else float(offside_x))
 
 class MainWindow(QWidget):
     """Main application window for Tactikz with timeline and tools panels."""
@@ -245,7 +348,7 @@ class MainWindow(QWidget):
           applies the current theme.
         - Instantiates managers: frames, trajectories, annotations, tactical
           simulation, score, camera, and settings, and wires their signals.
-        - Sets the initial camera view to "full" after the first render.
+        - Sets the initial camera view to "full" when the window is first shown.
         """
         super().__init__()
         self.setWindowTitle("Tactikz")
@@ -272,31 +375,67 @@ class MainWindow(QWidget):
         self.simulation_mode = False
         self.is_playing = False
         self.frame_step = 1
+        self._render_ema = 0.0  # Smoothed update_scene duration (s) during playback
         self.current_tool = "select"
         self.simulation_start_frame = 0
         self.simulation_end_frame = 0
         self.simulation_loop_active = False
+        self._stale_frame = None  # Frame requested while hidden/minimized, rendered on restore
+        # Simulated trajectories are only recomputed when their inputs change
+        self._traj_cache_key = None
+        self._traj_cache_value = None
+        self._last_rendered = None  # Frame and display state of the last update_scene render
+        # Mouse-move previews are coalesced to at most one redraw per ~16 ms
+        self._pending_preview_pos = None
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(16)
+        self._preview_timer.timeout.connect(self._flush_preview)
+        # Annotation hit-test box, reused across pointer events
+        self._hit_rect = QRectF()
+        self._hit_tol = 5.0  # pixels tolerance
+        # Forced redraws (theme/settings changes) requested in one event-loop tick collapse into one
+        self._full_refresh_timer = QTimer(self)
+        self._full_refresh_timer.setSingleShot(True)
+        self._full_refresh_timer.setInterval(0)
+        self._full_refresh_timer.timeout.connect(lambda: self.update_scene(self.timeline_widget.value(), force=True))
 
         # Actions
         self.actions_data = extract_match_actions_from_events(events, FPS, n_frames_firstHalf)
+
+        # Score label colors never change during a match
+        if SCORE_DARK_BG:
+            self._score_bg_fg = ("#000000", "#ffffff")
+        else:
+            self._score_bg_fg = ("#ffffff", "#000000")
+        self._last_score = None
+        self._score_html = (
+            f'<span style="color: {HOME_MAIN_COLOR}; font-weight: bold;">{home_team_name}</span> '
+            f'<span style="color: {self._score_bg_fg[1]}; font-weight: bold;"> {{}} - {{}} </span> '
+            f'<span style="color: {AWAY_MAIN_COLOR}; font-weight: bold;">{away_team_name}</span>'
+        )
         
         self._setup_ui()
         self._setup_managers()
         self._connect_signals()
         # Precompute and cache themes at startup to remove latency when switching
+        # Use current teams; cache key includes teams so it will be reused
+        home_team_colors = home_colors.get(home_ids[0], []) if home_ids else []
+        away_team_colors = away_colors.get(away_ids[0], []) if away_ids else []
+        home_main = home_team_colors[0] if home_team_colors else "#FFFFFF"
+        home_sec  = home_team_colors[1] if len(home_team_colors) > 1 else "#CCCCCC"
+        away_main = away_team_colors[0] if away_team_colors else "#000000"
+        away_sec  = away_team_colors[1] if len(away_team_colors) > 1 else "#444444"
+        self._theme_team_colors = (home_main, away_main, home_sec, away_sec)
         for _mode in ("CLASSIC", "BLACK & WHITE"):
-            # Use current teams; cache key includes teams so it will be reused
-            home_main = home_colors[home_ids[0]][0] if home_ids and home_ids[0] in home_colors else "#FFFFFF"
-            home_sec  = home_colors[home_ids[0]][1] if home_ids and home_ids[0] in home_colors and len(home_colors[home_ids[0]]) > 1 else "#CCCCCC"
-            away_main = away_colors[away_ids[0]][0] if away_ids and away_ids[0] in away_colors else "#000000"
-            away_sec  = away_colors[away_ids[0]][1] if away_ids and away_ids[0] in away_colors and len(away_colors[away_ids[0]]) > 1 else "#444444"
-            _ = self.theme_mgr.generate(_mode, home_main, away_main, home_sec, away_sec)
+            self.theme_mgr.generate(_mode, *self._theme_team_colors)
         # Apply current selection (now a cache hit)
         self.on_theme_mode_changed(self.theme_combo.currentText())
 
 
         self.update_scene(0)
-        QTimer.singleShot(1, lambda: self.camera_manager.set_camera_mode("full", animate=False))
+        # Initial "full" camera view is applied on first show (see showEvent)
+        self._camera_initialized = False
 
 
 
@@ -317,6 +456,17 @@ class MainWindow(QWidget):
         # SCORE on the left
         self.score_label = QLabel()
         self.score_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        # Stylesheet is constant for the match: set it once, not per frame
+        self.score_label.setStyleSheet(f"""
+            QLabel {{
+                font-size: 20px;
+                font-family: Arial;
+                font-weight: bold;
+                background: {self._score_bg_fg[0]};
+                padding: 6px 6px;
+                border-radius: 6px;
+            }}
+        """)
         self._update_score_display(0)
         self.score_label.setSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Preferred)
         score_layout.addWidget(self.score_label)  # priority + large
@@ -368,38 +518,13 @@ class MainWindow(QWidget):
     
     def _update_score_display(self, frame):
         """Update the score label with team colors and current score at frame."""
-        home_score, away_score = self.score_manager.get_score_at_frame(frame)
-        home_main_color = home_colors[home_ids[0]][0]
-        away_main_color = away_colors[away_ids[0]][0]
-        home_sec_color = home_colors[home_ids[0]][1]
-        away_sec_color = away_colors[away_ids[0]][1]
-        all_colors = [home_main_color, away_main_color, home_sec_color, away_sec_color]
-        if majority_light(all_colors):
-            background_color = "#000000"
-            score_color = "#ffffff"
-        else:
-            background_color = "#ffffff"
-            score_color = "#000000"
-        
-        score_html = f"""
-        <span style="color: {home_main_color}; font-weight: bold;">{home_team_name}</span>
-        <span style="color: {score_color}; font-weight: bold;"> {home_score} - {away_score} </span>
-        <span style="color: {away_main_color}; font-weight: bold;">{away_team_name}</span>
-        """
-        
-        self.score_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: 20px;
-                font-family: Arial;
-                font-weight: bold;
-                background: {background_color};
-                padding: 6px 6px;
-                border-radius: 6px;
-            }}
-        """)
-        
-        self.score_label.setText(score_html)
-        self.score_label.adjustSize()
+        score = self.score_manager.get_score_at_frame(frame)
+        # Score only changes at goal frames: skip redundant HTML/setText work
+        if score == self._last_score:
+            return
+        self._last_score = score
+        home_score, away_score = score
+        self.score_label.setText(self._score_html.format(home_score, away_score))
 
     
     def _create_timeline_controls(self, parent_layout):
@@ -416,7 +541,13 @@ class MainWindow(QWidget):
         nav_layout.addWidget(create_nav_button("< 5s", NAV_BUTTON_WIDTH, NAV_BUTTON_HEIGHT, -5 * FPS, "Back 5 seconds", self.jump_frames))
         
         self.timeline_widget = TimelineWidget(n_frames, n_frames_firstHalf, n_frames_secondHalf)
-        self.timeline_widget.frameChanged.connect(self.update_scene)
+        self.timeline_widget.frameChanged.connect(self._schedule_scene_update)
+        # Coalesce bursts of frame changes (slider drags) into one render of the latest frame
+        self._pending_frame = 0
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(8)
+        self._render_timer.timeout.connect(lambda: self.update_scene(self._pending_frame))
         self.timeline_widget.set_actions(self.actions_data)
         nav_layout.addWidget(self.timeline_widget)
         nav_layout.addWidget(create_nav_button("5s >", NAV_BUTTON_WIDTH, NAV_BUTTON_HEIGHT, 5 * FPS, "Forward 5 seconds", self.jump_frames))
@@ -515,8 +646,9 @@ class MainWindow(QWidget):
         control_layout.addWidget(self.visual_overlays_button)
         
         self.orientation_action.toggled.connect(lambda _: self.update_scene(self.timeline_widget.value()))
-        self.offside_action.toggled.connect(lambda _: self.update_scene(self.timeline_widget.value()))
-        self.pressure_action.toggled.connect(lambda _: self.update_scene(self.timeline_widget.value()))
+        # Offside/pressure only need a visibility flip (orientation also rotates the players)
+        self.offside_action.toggled.connect(lambda checked: self._on_overlay_toggled('offside', checked))
+        self.pressure_action.toggled.connect(lambda checked: self._on_overlay_toggled('pressure', checked))
 
         # Info label
         self.info_label = QLabel("")
@@ -528,9 +660,22 @@ class MainWindow(QWidget):
         
         # Timer
         self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.timer.setInterval(40)
         self.timer.timeout.connect(self.next_frame)
     
+    def _schedule_scene_update(self, frame_number):
+        """Queue a render of `frame_number`, merging it with any pending one.
+
+        Parameters
+        ----------
+        frame_number : int
+            Latest global frame index requested by the timeline.
+        """
+        self._pending_frame = frame_number
+        if not self._render_timer.isActive():
+            self._render_timer.start()
+
     def _create_tools_panel(self):
         """Build the right tools panel (simulation, trajectories, annotation)."""
         tools_panel = QVBoxLayout()
@@ -547,6 +692,8 @@ class MainWindow(QWidget):
         self.sim_interval_spin.setValue(10.0)
         self.sim_interval_spin.setSuffix(" sec")
         self.sim_interval_spin.setSingleStep(0.5)
+        # Interval length in frames, kept in sync by update_simulation_interval
+        self._sim_interval_frames = int(self.sim_interval_spin.value() * FPS)
         self.sim_interval_spin.valueChanged.connect(self.update_simulation_interval)
         tools_panel.addWidget(QLabel("Future interval:"))
         tools_panel.addWidget(self.sim_interval_spin)
@@ -606,6 +753,22 @@ class MainWindow(QWidget):
         
         return tools_panel
     
+    def showEvent(self, event):
+        """Apply the initial "full" camera view once the window is laid out."""
+        super().showEvent(event)
+        if not self._camera_initialized:
+            self.camera_manager.set_camera_mode("full", animate=False)
+            self._camera_initialized = True
+        if self._stale_frame is not None:
+            self.update_scene(self._stale_frame)
+
+    def changeEvent(self, event):
+        """Render the frame skipped while minimized once the window is restored."""
+        super().changeEvent(event)
+        if (event.type() == QEvent.Type.WindowStateChange and not self.isMinimized()
+                and self._stale_frame is not None):
+            self.update_scene(self._stale_frame)
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
         # Nothing custom yet; placeholder in case we need responsive tweaks
@@ -616,11 +779,36 @@ class MainWindow(QWidget):
 
     def _setup_managers(self):
         """Create managers (trajectory, annotation, tactical, camera) and UI hooks."""
+        # Annotation/simulation modules are only needed once the window is built
+        from annotation.annotation import (
+            ArrowAnnotationManager, RectangleZoneManager, EllipseZoneManager, ConeZoneManager,
+            CustomArrowItem, RectangleZoneItem, EllipseZoneItem, ConeZoneItem,
+        )
+        from annotation.arrow.arrow_properties import ArrowProperties
+        from annotation.arrow.arrow_player_selection import ArrowPlayerSelection
+        from annotation.zone_properties import ZoneProperties, ConeZoneProperties
+        from tactical_simulation import TacticalSimulationManager
+
         self.trajectory_manager = TrajectoryManager(self.pitch_widget, home_colors, away_colors)
         self.annotation_manager = ArrowAnnotationManager(self.pitch_widget.scene)
         self.rectangle_zone_manager = RectangleZoneManager(self.pitch_widget.scene)
         self.ellipse_zone_manager = EllipseZoneManager(self.pitch_widget.scene)
         self.cone_zone_manager = ConeZoneManager(self.pitch_widget.scene)
+        self._selection_managers = (
+            self.annotation_manager, self.rectangle_zone_manager,
+            self.ellipse_zone_manager, self.cone_zone_manager,
+        )
+        # Item classes used to identify annotations under the pointer
+        self._arrow_item_type = CustomArrowItem
+        # Each zone item class belongs to exactly one manager
+        self._zone_manager_by_type = {
+            RectangleZoneItem: self.rectangle_zone_manager,
+            EllipseZoneItem: self.ellipse_zone_manager,
+            ConeZoneItem: self.cone_zone_manager,
+        }
+        self._zone_item_types = tuple(self._zone_manager_by_type)
+        # Player picker opened after drawing an arrow in simulation mode
+        self._player_selection_dialog = ArrowPlayerSelection
         self.tactical_manager = TacticalSimulationManager(
             self.annotation_manager, self.pitch_widget, 
             home_ids, away_ids, home_colors, away_colors
@@ -649,27 +837,7 @@ class MainWindow(QWidget):
     
     def _setup_arrow_context_menu(self):
         """Prepare the arrow properties popup and wire its signals."""
-        # Prepare player data with ALL colors
-        home_players = {}
-        away_players = {}
-        
-        for player_id in home_ids:
-            number = id2num.get(player_id, "?")
-            colors = home_colors.get(player_id, ["#FF0000", "#FFFFFF", "#000000"])
-            main_color = colors[0]
-            sec_color = colors[1] if len(colors) > 1 else colors[0]
-            num_color = colors[2] if len(colors) > 2 else "#000000"
-            home_players[player_id] = (number, main_color, sec_color, num_color)
-        
-        for player_id in away_ids:
-            number = id2num.get(player_id, "?")
-            colors = away_colors.get(player_id, ["#0000FF", "#FFFFFF", "#000000"])
-            main_color = colors[0]
-            sec_color = colors[1] if len(colors) > 1 else colors[0]
-            num_color = colors[2] if len(colors) > 2 else "#000000"
-            away_players[player_id] = (number, main_color, sec_color, num_color)
-        
-        self.arrow_context_menu.set_players_data(home_players, away_players)
+        self.arrow_context_menu.set_players_data(HOME_PLAYERS_DATA, AWAY_PLAYERS_DATA)
         
         # Connect signals
         self.arrow_context_menu.fromPlayerSelected.connect(self._on_from_player_selected)
@@ -712,7 +880,7 @@ class MainWindow(QWidget):
         if self.simulation_mode:
             self._pause_match()
             current_frame = self.timeline_widget.value()
-            interval_frames = int(self.sim_interval_spin.value() * FPS)
+            interval_frames = self._sim_interval_frames
             
             self.simulation_start_frame = current_frame
             self.simulation_end_frame = min(current_frame + interval_frames, n_frames - 1)
@@ -729,13 +897,14 @@ class MainWindow(QWidget):
             
             self.annotation_manager.set_tactical_mode(False)
             self.tactical_manager.clear_tactical_data()
+            self._traj_cache_key = None
             
         self.update_scene(self.timeline_widget.value())
 
     def _update_loop_times_display(self):
         """Update the small label that shows the loop start and end times."""
-        start_time = format_match_time(self.simulation_start_frame, n_frames_firstHalf, n_frames_secondHalf, 0, 0, fps=FPS)
-        end_time = format_match_time(self.simulation_end_frame, n_frames_firstHalf, n_frames_secondHalf, 0, 0, fps=FPS)
+        start_time = get_match_time(self.simulation_start_frame)
+        end_time = get_match_time(self.simulation_end_frame)
         self.loop_times_label.setText(f"Loop: {start_time} → {end_time}")
 
     def update_simulation_interval(self, value):
@@ -746,52 +915,89 @@ class MainWindow(QWidget):
         value : float
             Interval in seconds to preview or simulate.
         """
+        self._sim_interval_frames = int(value * FPS)
         if self.simulation_mode:
             current_frame = self.simulation_start_frame
-            interval_frames = int(value * FPS)
-            self.simulation_end_frame = min(current_frame + interval_frames, n_frames - 1)
+            self.simulation_end_frame = min(current_frame + self._sim_interval_frames, n_frames - 1)
             
             self._update_loop_times_display()
             
             if not self.is_playing:
                 self.update_scene(self.timeline_widget.value())
 
-    def update_scene(self, frame_number):
+    def update_scene(self, frame_number, force=False):
         """Redraw everything for a global frame: pitch, players, ball, overlays.
 
         Parameters
         ----------
         frame_number : int
             Global frame index to render.
+        force : bool, default False
+            Redraw even if the frame and display state match the last render
+            (used when colors, theme or tactical data changed).
         """
-        self._update_score_display(frame_number)
-        
+        # Nothing is visible while hidden/minimized: keep the frame for later
+        if not self.isVisible() or self.isMinimized():
+            self._stale_frame = frame_number
+            return
+        self._stale_frame = None
+
+        # Widget state read once per redraw and passed down
+        timeline_value = self.timeline_widget.value()
+        interval_s = self.sim_interval_spin.value()
+        show_traj = self.show_trajectories_checkbox.isChecked()
+        show_ori = self.orientation_action.isChecked()
+        show_off = self.offside_action.isChecked()
+        show_pres = self.pressure_action.isChecked()
+
+        # Moving away from a paused simulation restarts its window here, so the
+        # render key below sees the window this frame is drawn with
         if (self.simulation_mode and 
             not self.is_playing and 
             abs(frame_number - self.simulation_start_frame) > 5):
             
-            interval_frames = int(self.sim_interval_spin.value() * FPS)
+            interval_frames = self._sim_interval_frames
             self.simulation_start_frame = frame_number
             self.simulation_end_frame = min(frame_number + interval_frames, n_frames - 1)
             self.simulation_loop_active = False
             self._update_loop_times_display()
+
+        # Same frame and same display state as the last render: nothing to redo
+        render_key = (frame_number, timeline_value, interval_s, show_traj, show_off, show_pres, show_ori,
+                      self.simulation_mode, self.simulation_start_frame, self.simulation_end_frame)
+        if not force and render_key == self._last_rendered:
+            return
+        self._last_rendered = render_key
+        render_start = time.perf_counter()
+
+        self._update_score_display(frame_number)
         
         self.pitch_widget.clear_dynamic()
         self.pitch_widget.draw_pitch()
+        self.trajectory_manager.begin_frame()
         
-        half, idx, halftime = self.frame_manager.get_frame_data(frame_number)
+        get_frame_data_fn = self.frame_manager.get_frame_data
+        half, idx, halftime = get_frame_data_fn(frame_number)
         
         # Simulation mode: trajectories rendering
-        if self.simulation_mode and self.show_trajectories_checkbox.isChecked():
+        if self.simulation_mode and show_traj:
             if self.tactical_manager.tactical_arrows and not SIMULATION_ONLY_ARROWS:
-                self.tactical_manager.calculate_simulated_trajectories(
-                    self.sim_interval_spin.value(),
+                traj_key = (
                     self.simulation_start_frame,
-                    xy_objects,
-                    n_frames,
-                    self.frame_manager.get_frame_data
+                    interval_s,
+                    tuple((ta['arrow_id'], ta.get('receiver_id')) for ta in self.tactical_manager.tactical_arrows.values()),
                 )
-                simulated_data = self.tactical_manager.get_simulated_trajectories()
+                if traj_key != self._traj_cache_key:
+                    self.tactical_manager.calculate_simulated_trajectories(
+                        interval_s,
+                        self.simulation_start_frame,
+                        xy_objects,
+                        n_frames,
+                        get_frame_data_fn
+                    )
+                    self._traj_cache_key = traj_key
+                    self._traj_cache_value = self.tactical_manager.get_simulated_trajectories()
+                simulated_data = self._traj_cache_value
                 self.trajectory_manager.draw_simulated_trajectories(
                     simulated_data,
                     frame_number,
@@ -802,12 +1008,12 @@ class MainWindow(QWidget):
             else:
                 self.trajectory_manager.calculate_future_trajectories(
                     self.simulation_start_frame,
-                    self.sim_interval_spin.value(),
+                    interval_s,
                     xy_objects,
                     home_ids,
                     away_ids,
                     n_frames,
-                    self.frame_manager.get_frame_data
+                    get_frame_data_fn
                 )
                 self.trajectory_manager.draw_future_trajectories(
                     current_frame=frame_number,
@@ -815,9 +1021,10 @@ class MainWindow(QWidget):
                     loop_end=self.simulation_end_frame,
                     ball_color=self.settings_manager.ball_color
                 )
+        self.trajectory_manager.end_frame()
         
         # Draw players
-        self._draw_players(half, idx)
+        self._draw_players(half, idx, timeline_value, show_ori)
         
         # Ball
         ball_xy = xy_objects[half]["Ball"].xy[idx]
@@ -826,26 +1033,56 @@ class MainWindow(QWidget):
         
         self.camera_manager.update_ball_position(ball_x, ball_y)
         
-        # Offside
-        possession_team = PossessionTracker.get_possession_for_frame(possession, half, idx)
-        offside_x = get_offside_line_x(xy_objects, half, idx, possession_team, 
-                                    home_ids, away_ids, teams_df, last_positions)
-        self.pitch_widget.draw_offside_line(offside_x, visible=self.offside_action.isChecked(), color=self.settings_manager.offside_color)
+        # Offside and pressure overlays: nothing is computed while they are off
+        if show_off:
+            self._draw_offside(frame_number)
+        if show_pres:
+            self._draw_pressure(frame_number)
+
+    
+        # Info
+        match_time = get_match_time(frame_number)
+        self.info_label.setText(f"{halftime} \n{match_time}  \nFrame {idx}")
+
+        if self.is_playing:
+            elapsed = time.perf_counter() - render_start
+            self._render_ema += PLAYBACK_RENDER_EMA_ALPHA * (elapsed - self._render_ema)
+
+    def _draw_offside(self, frame_number):
+        """Draw the offside line for a global frame."""
+        _poss_code, offside_x = compute_frame_features(frame_number)
+        self.pitch_widget.draw_offside_line(offside_x, visible=True, color=self.settings_manager.offside_color)
+
+    def _draw_pressure(self, frame_number):
+        """Draw the ball carrier pressure for a global frame."""
+        half, idx, _ = self.frame_manager.get_frame_data(frame_number)
+        ball_xy = xy_objects[half]["Ball"].xy[idx]
         self.pitch_widget.draw_pressure_for_ball_carrier(xy_objects, home_ids,
                                                 away_ids, dsam, player_orientations, half, idx, ball_xy,
                                                 compute_pressure, ball_carrier_array, ballstatus=ballstatus, frame_number=frame_number,
-                                                visible=self.pressure_action.isChecked(),
+                                                visible=True, pid_index=PID_IDX,
                 )
 
-    
-        # Info
-        match_time = format_match_time(frame_number, n_frames_firstHalf, 
-                                    n_frames_secondHalf, 0, 0, fps=FPS)
-        
+    def _on_overlay_toggled(self, name, checked):
+        """Toggle an overlay by flipping its items' visibility, without a full redraw.
 
-        self.info_label.setText(f"{halftime} \n{match_time}  \nFrame {get_frame_data(frame_number)[1]}")
+        Parameters
+        ----------
+        name : {'offside','pressure'}
+            Overlay key.
+        checked : bool
+            New overlay state.
+        """
+        if self.pitch_widget.set_overlay_visible(name, checked) or not checked:
+            return
+        # Overlay was off when the current frame was rendered: draw it alone now
+        frame_number = self.timeline_widget.value()
+        if name == 'offside':
+            self._draw_offside(frame_number)
+        else:
+            self._draw_pressure(frame_number)
 
-    def _draw_players(self, half, idx):
+    def _draw_players(self, half, idx, timeline_value, show_orientation):
         """Draw all players for a half/index with colors, numbers, and orientation.
 
         Parameters
@@ -854,28 +1091,42 @@ class MainWindow(QWidget):
             Current half.
         idx : int
             Frame index within the half.
+        timeline_value : int
+            Global frame shown by the timeline, used for orientations.
+        show_orientation : bool
+            Whether orientation arrows are drawn.
         """
-        for side, ids, colors in [("Home", home_ids, home_colors), 
-                                 ("Away", away_ids, away_colors)]:
-            xy = xy_objects[half][side].xy[idx]
-            for i, pid in enumerate(ids):
-                try:
-                    x, y = xy[2*i], xy[2*i+1]
-                    if not np.isnan(x) and not np.isnan(y):
-                        main, sec, numc = colors[pid]
-                        num = id2num.get(pid, "")
-                        self.pitch_widget.draw_player(
-                            x=x, y=y, 
-                            main_color=main, sec_color=sec, num_color=numc, 
-                            number=num,
-                            angle=player_orientations[pid][self.timeline_widget.value()],
-                            velocity=dsam[side][pid][half]['S'][idx],
-                            display_orientation=self.orientation_action.isChecked(),
-                            z_offset=(10 if side == "Home" else 50) + i,
-                            arrow_color=self.settings_manager.arrow_color
-                        )
-                except IndexError:
-                    continue
+        t = timeline_value
+        arrow_color = self.settings_manager.arrow_color or ""
+        batches = []
+        for side, ids in (("Home", home_ids), ("Away", away_ids)):
+            # One (n_players, 2) view per side; NaN test done once for all players
+            xy_r = xy_objects[half][side].xy[idx, :2*len(ids)].reshape(-1, 2)
+            sel = np.flatnonzero(~np.isnan(xy_r).any(axis=1))
+            # A player whose orientation or speed series ends before this
+            # frame is skipped, as the per-player IndexError used to do
+            sel = sel[(ORIENT_LEN[side][sel] > t) & (SPEED_LEN[(side, half)][sel] > idx)]
+            if not len(sel):
+                continue
+            soa = PLAYER_SOA[side]
+            rec = np.empty(len(sel), dtype=PLAYER_RECORD_DTYPE)
+            rec['x'] = xy_r[sel, 0]
+            rec['y'] = xy_r[sel, 1]
+            rec['main'] = soa['main'][sel]
+            rec['sec'] = soa['sec'][sel]
+            rec['numc'] = soa['numc'][sel]
+            rec['number'] = soa['number'][sel]
+            rec['angle'] = ORIENT_STACK[side][sel, t]
+            rec['velocity'] = SPEED_STACK[(side, half)][sel, idx]
+            rec['z'] = soa['z'][sel]
+            rec['arrow_color'] = arrow_color
+            batches.append(rec)
+        if not batches:
+            return
+        self.pitch_widget.draw_players_batch(
+            np.concatenate(batches),
+            display_orientation=show_orientation
+        )
     
     def jump_frames(self, n):
         """Jump forward/backward by N frames, respecting simulation loop rules.
@@ -892,7 +1143,7 @@ class MainWindow(QWidget):
         self.timeline_widget.setValue(new_frame)
         
         if self.simulation_mode:
-            interval_frames = int(self.sim_interval_spin.value() * FPS)
+            interval_frames = self._sim_interval_frames
             self.simulation_start_frame = new_frame
             self.simulation_end_frame = min(new_frame + interval_frames, n_frames - 1)
             self.simulation_loop_active = False
@@ -900,6 +1151,8 @@ class MainWindow(QWidget):
 
     def toggle_play_pause(self):
         """Toggle playback. In simulation, toggles the loop state text as well."""
+        # Antialiasing only while paused: playback frames are too short-lived to need it
+        self.pitch_widget.set_antialiasing(self.is_playing)
         if self.is_playing:
             self.play_button.setIcon(self.play_icon)
             if self.simulation_mode:
@@ -907,6 +1160,8 @@ class MainWindow(QWidget):
             else:
                 self.play_button.setText("")
             self.timer.stop()
+            self.frame_step = 1
+            self._render_ema = 0.0
         else:
             self.play_button.setIcon(self.pause_icon)
             if self.simulation_mode:
@@ -929,7 +1184,17 @@ class MainWindow(QWidget):
         self.timer.setInterval(intervals[idx])
 
     def next_frame(self):
-        """Advance playback by one step, looping if simulation loop is active."""
+        """Advance playback by one step, looping if simulation loop is active.
+
+        The step grows while the smoothed render time exceeds the timer
+        interval, so playback stays real-time by skipping frames, and falls
+        back to 1 once rendering keeps up again.
+        """
+        budget = self.timer.interval() / 1000.0
+        if budget > 0 and self._render_ema > budget:
+            self.frame_step = min(PLAYBACK_MAX_FRAME_STEP, math.ceil(self._render_ema / budget))
+        else:
+            self.frame_step = 1
         current_frame = self.timeline_widget.value()
         
         if self.simulation_mode and self.simulation_loop_active:
@@ -1130,8 +1395,7 @@ class MainWindow(QWidget):
             # In select mode: handle only initial clicks
             if event.type() == QEvent.Type.MouseButtonPress:
                 scene_pos = self.pitch_widget.view.mapToScene(event.position().toPoint())
-                clicked_arrow = self._find_arrow_at_position(scene_pos)
-                clicked_zone = self._find_zone_at_position(scene_pos)
+                clicked_arrow, clicked_zone = self._find_annotations_at_position(scene_pos)
                 
 
                                 
@@ -1139,42 +1403,25 @@ class MainWindow(QWidget):
                     if clicked_arrow:
                         # Simple left click: select only
                         self.annotation_manager.select_arrow(clicked_arrow)
-                        self.rectangle_zone_manager.clear_selection()
-                        self.ellipse_zone_manager.clear_selection()
-                        self.cone_zone_manager.clear_selection()
+                        self._clear_all_selections_except(self.annotation_manager)
                         # IMPORTANT: Don't return True here to allow dragging
                         return False  # Let Qt handle drag & drop
                     elif clicked_zone:
                         # Select zone
-                        self.annotation_manager.clear_selection()
-                        if clicked_zone in self.rectangle_zone_manager.zones:
-                            self.rectangle_zone_manager.select_zone(clicked_zone)
-                            self.ellipse_zone_manager.clear_selection()
-                            self.cone_zone_manager.clear_selection()
-                        elif clicked_zone in self.ellipse_zone_manager.zones:
-                            self.ellipse_zone_manager.select_zone(clicked_zone)
-                            self.rectangle_zone_manager.clear_selection()
-                            self.cone_zone_manager.clear_selection()
-                        else:
-                            self.cone_zone_manager.select_zone(clicked_zone)
-                            self.rectangle_zone_manager.clear_selection()
-                            self.ellipse_zone_manager.clear_selection()
+                        zone_manager = self._zone_manager_for(clicked_zone)
+                        zone_manager.select_zone(clicked_zone)
+                        self._clear_all_selections_except(zone_manager)
                         return False  # Let Qt handle drag & drop
                     else:
                         # Click on empty area: clear selection
-                        self.annotation_manager.clear_selection()
-                        self.rectangle_zone_manager.clear_selection()
-                        self.ellipse_zone_manager.clear_selection()
-                        self.cone_zone_manager.clear_selection()
+                        self._clear_all_selections_except(None)
                         return True  # We can intercept this
                         
                 elif event.button() == Qt.MouseButton.RightButton:
                     if clicked_arrow:
                         # Right click: select AND open properties menu
                         self.annotation_manager.select_arrow(clicked_arrow)
-                        self.rectangle_zone_manager.clear_selection()
-                        self.ellipse_zone_manager.clear_selection()
-                        self.cone_zone_manager.clear_selection()
+                        self._clear_all_selections_except(self.annotation_manager)
                         
                         global_pos = self.pitch_widget.view.mapToGlobal(event.position().toPoint())
                         # Adjust position to keep menu within screen bounds
@@ -1190,22 +1437,13 @@ class MainWindow(QWidget):
                     elif clicked_zone:
 
                         # Right click: select AND open zone properties menu
-                        self.annotation_manager.clear_selection()
-                        if clicked_zone in self.rectangle_zone_manager.zones:
-                            self.rectangle_zone_manager.select_zone(clicked_zone)
-                            self.ellipse_zone_manager.clear_selection()
-                            self.cone_zone_manager.clear_selection()
-                            menu = self.zone_context_menu
-                        elif clicked_zone in self.ellipse_zone_manager.zones:
-                            self.ellipse_zone_manager.select_zone(clicked_zone)
-                            self.rectangle_zone_manager.clear_selection()
-                            self.cone_zone_manager.clear_selection()
-                            menu = self.zone_context_menu
+                        zone_manager = self._zone_manager_for(clicked_zone)
+                        zone_manager.select_zone(clicked_zone)
+                        self._clear_all_selections_except(zone_manager)
+                        if zone_manager is self.cone_zone_manager:
+                            menu = self.cone_zone_context_menu
                         else:
-                            self.cone_zone_manager.select_zone(clicked_zone)
-                            self.rectangle_zone_manager.clear_selection()
-                            self.ellipse_zone_manager.clear_selection()
-                            menu = self.cone_zone_context_menu 
+                            menu = self.zone_context_menu
                         
                         global_pos = self.pitch_widget.view.mapToGlobal(event.position().toPoint())
                         # Adjust position to keep menu within screen bounds
@@ -1236,20 +1474,9 @@ class MainWindow(QWidget):
                         if new_arrow and self.simulation_mode:
                             # Determine action type based on style
                             action_type = self.tactical_manager.get_action_type(new_arrow)
-                            # Prepare player datasets for selection
-                            home_players = {}
-                            away_players = {}
-                            for player_id in home_ids:
-                                number = id2num.get(player_id, "?")
-                                main_color, sec_color, num_color = home_colors.get(player_id, ("#4CAF50", "#2E7D32", "#FFFFFF"))
-                                home_players[player_id] = (number, main_color, sec_color, num_color)
-                            for player_id in away_ids:
-                                number = id2num.get(player_id, "?")
-                                main_color, sec_color, num_color = away_colors.get(player_id, ("#F44336", "#B71C1C", "#FFFFFF"))
-                                away_players[player_id] = (number, main_color, sec_color, num_color)
 
                             # Show selection dialog(s) according to action type
-                            from annotation.arrow.arrow_player_selection import ArrowPlayerSelection
+                            ArrowPlayerSelection = self._player_selection_dialog
                             # Compute default candidates: nearest to start/end
                             start_pt = new_arrow.arrow_points[0]
                             end_pt = new_arrow.arrow_points[-1]
@@ -1257,14 +1484,14 @@ class MainWindow(QWidget):
                             default_to = self.tactical_manager.find_player_at_position(end_pt, self.timeline_widget.value(), xy_objects, self.frame_manager.get_frame_data) if action_type == 'pass' else None
 
                             # From player (always)
-                            dlg_from = ArrowPlayerSelection(home_players, away_players, title="Select From Player", parent=self, default_selected_id=default_from)
+                            dlg_from = ArrowPlayerSelection(HOME_PLAYERS_DATA, AWAY_PLAYERS_DATA, title="Select From Player", parent=self, default_selected_id=default_from)
                             if dlg_from.exec() == dlg_from.DialogCode.Accepted:
                                 from_id = dlg_from.selected_player_id
                                 if from_id:
                                     current_frame = self.timeline_widget.value()
                                     self.tactical_manager.associate_arrow_with_player(new_arrow, from_id, current_frame, xy_objects)
                                     # Color the arrow with the team's main color
-                                    if from_id in home_ids:
+                                    if from_id in HOME_PID_IDX:
                                         team_color = home_colors.get(from_id, ["#4CAF50"])[0]
                                     else:
                                         team_color = away_colors.get(from_id, ["#F44336"])[0]
@@ -1273,7 +1500,7 @@ class MainWindow(QWidget):
                                         new_arrow.refresh_visual()
                             # For pass: also select receiver
                             if action_type == 'pass':
-                                dlg_to = ArrowPlayerSelection(home_players, away_players, title="Select To Player", parent=self, default_selected_id=default_to)
+                                dlg_to = ArrowPlayerSelection(HOME_PLAYERS_DATA, AWAY_PLAYERS_DATA, title="Select To Player", parent=self, default_selected_id=default_to)
                                 if dlg_to.exec() == dlg_to.DialogCode.Accepted:
                                     to_id = dlg_to.selected_player_id
                                     if to_id:
@@ -1281,7 +1508,7 @@ class MainWindow(QWidget):
 
                             # Refresh simulated preview immediately
                             if self.show_trajectories_checkbox.isChecked():
-                                self.update_scene(self.timeline_widget.value())
+                                self.update_scene(self.timeline_widget.value(), force=True)
                         self.set_tool_mode("select")
                 elif event.button() == Qt.MouseButton.RightButton:
                     if len(self.annotation_manager.arrow_points) < 2:
@@ -1291,7 +1518,7 @@ class MainWindow(QWidget):
             
             elif event.type() == QEvent.Type.MouseMove and self.annotation_manager.arrow_points:
                 scene_pos = self.pitch_widget.view.mapToScene(event.position().toPoint())
-                self.annotation_manager.update_preview(scene_pos)
+                self._queue_preview(scene_pos)
                 return True
         
         # Zone creation modes (rectangle/ellipse/cone)
@@ -1303,6 +1530,8 @@ class MainWindow(QWidget):
                         self.pitch_widget.view.viewport().setMouseTracking(True)
                     except Exception:
                         pass
+                    # The preview is reshaped on every move: stop BSP re-indexing until release
+                    self.pitch_widget.set_item_indexing(False)
                     scene_pos = self.pitch_widget.view.mapToScene(event.position().toPoint())
                     if self.current_tool == "rectangle_zone":
                         self.rectangle_zone_manager.add_point(scene_pos)
@@ -1320,21 +1549,18 @@ class MainWindow(QWidget):
                         self.ellipse_zone_manager.cancel_zone()
                     else:
                         self.cone_zone_manager.cancel_zone()
+                    self.pitch_widget.set_item_indexing(True)
                     self.set_tool_mode("select")
                 return True
             
             elif event.type() == QEvent.Type.MouseMove:
                 scene_pos = self.pitch_widget.view.mapToScene(event.position().toPoint())
-                if self.current_tool == "rectangle_zone":
-                    self.rectangle_zone_manager.update_preview(scene_pos)
-                elif self.current_tool == "ellipse_zone":
-                    self.ellipse_zone_manager.update_preview(scene_pos)
-                else:
-                    self.cone_zone_manager.update_preview(scene_pos)
+                self._queue_preview(scene_pos)
                 return True
             
             elif event.type() == QEvent.Type.MouseButtonRelease:
                 if event.button() == Qt.MouseButton.LeftButton:
+                    self.pitch_widget.set_item_indexing(True)
                     if self.current_tool == "rectangle_zone":
                         if self.rectangle_zone_manager.finish_zone():
                             self.set_tool_mode("select")
@@ -1348,37 +1574,62 @@ class MainWindow(QWidget):
         
         return False
     
-    def _find_arrow_at_position(self, scene_pos):
-        """Look for an arrow item under the pointer within a small tolerance box.
+    def _queue_preview(self, scene_pos):
+        """Record the latest pointer position and schedule a preview update.
 
         Parameters
         ----------
         scene_pos : QPointF
-            Position in scene coordinates.
+            Pointer position in scene coordinates.
+        """
+        self._pending_preview_pos = scene_pos
+        if not self._preview_timer.isActive():
+            self._preview_timer.start()
+
+    def _flush_preview(self):
+        """Update the active tool's preview once with the latest pointer position."""
+        scene_pos = self._pending_preview_pos
+        self._pending_preview_pos = None
+        if scene_pos is None:
+            return
+        if self.current_tool in ("arrow", "curve"):
+            self.annotation_manager.update_preview(scene_pos)
+        elif self.current_tool == "rectangle_zone":
+            self.rectangle_zone_manager.update_preview(scene_pos)
+        elif self.current_tool == "ellipse_zone":
+            self.ellipse_zone_manager.update_preview(scene_pos)
+        elif self.current_tool == "cone_zone":
+            self.cone_zone_manager.update_preview(scene_pos)
 
-        Returns
-        -------
-        QGraphicsItemGroup | None
-            The arrow item if found; otherwise None.
+    def _clear_all_selections_except(self, keep):
+        """Clear the selection of every annotation manager but `keep`.
+
+        View updates are held while the managers clear, so the scene is
+        repainted once instead of once per manager.
+
+        Parameters
+        ----------
+        keep : object or None
+            Manager whose selection is preserved (None clears all).
         """
-        # Search scene items within a tolerance zone
-        tolerance = 5.0  # pixels tolerance
-        search_rect = QRectF(scene_pos.x() - tolerance, scene_pos.y() - tolerance, 
-                           tolerance * 2, tolerance * 2)
-        items = self.pitch_widget.scene.items(search_rect)
-        
-        for item in items:
-            # Check if the item is an arrow or part of an arrow
-            parent = item
-            while parent:
-                if parent in self.annotation_manager.arrows:
-                    return parent
-                parent = parent.parentItem()
-        
-        return None
+        view = self.pitch_widget.view
+        view.setUpdatesEnabled(False)
+        try:
+            for manager in self._selection_managers:
+                if manager is not keep:
+                    manager.clear_selection()
+        finally:
+            view.setUpdatesEnabled(True)
+
+    def _zone_manager_for(self, zone):
+        """Return the zone manager owning `zone` (cone manager by default)."""
+        return self._zone_manager_by_type.get(type(zone), self.cone_zone_manager)
 
-    def _find_zone_at_position(self, scene_pos):
-        """Look for a zone item under the pointer within a small tolerance box.
+    def _find_annotations_at_position(self, scene_pos):
+        """Look for the arrow and zone under the pointer within a small tolerance box.
+
+        One indexed scene query serves both lookups; parent chains shared by
+        sibling hits (arrow body, head, decorations) are walked only once.
 
         Parameters
         ----------
@@ -1387,29 +1638,42 @@ class MainWindow(QWidget):
 
         Returns
         -------
-        QGraphicsItemGroup | None
-            The zone item if found; otherwise None.
+        tuple[QGraphicsItemGroup | None, QGraphicsItemGroup | None]
+            Topmost arrow and topmost zone found (None when absent).
         """
-        # Search scene items within a tolerance zone
-        tolerance = 5.0  # pixels tolerance (increased for easier detection)
-        search_rect = QRectF(scene_pos.x() - tolerance, scene_pos.y() - tolerance, 
-                           tolerance * 2, tolerance * 2)
-        items = self.pitch_widget.scene.items(search_rect)
-        
+        # Nothing drawn yet: skip the scene query entirely
+        if not self.annotation_manager.arrows and not any(
+            manager.zones for manager in self._zone_manager_by_type.values()
+        ):
+            return None, None
 
+        # Search scene items within a tolerance zone
+        tol = self._hit_tol
+        self._hit_rect.setRect(scene_pos.x() - tol, scene_pos.y() - tol, tol * 2, tol * 2)
+        items = self.pitch_widget.scene.items(self._hit_rect)
         
+        arrow = zone = None
+        visited = set()
         for item in items:
-            # Check if the item is a zone or part of a zone
+            # Check if the item is part of an arrow or a zone (type check, not a list scan)
             parent = item
             while parent:
-                if (parent in self.rectangle_zone_manager.zones or
-                    parent in self.ellipse_zone_manager.zones or
-                    parent in self.cone_zone_manager.zones):
-                    return parent
+                if parent in visited:
+                    break  # Rest of this chain was already inspected
+                visited.add(parent)
+                if arrow is None and isinstance(parent, self._arrow_item_type):
+                    if parent is not self.annotation_manager.arrow_preview:
+                        arrow = parent
+                        break
+                elif zone is None and isinstance(parent, self._zone_item_types):
+                    if not getattr(parent, 'is_preview', False):
+                        zone = parent
+                        break
                 parent = parent.parentItem()
+            if arrow is not None and zone is not None:
+                break
         
-
-        return None
+        return arrow, zone
 
 
     def _on_arrow_properties_confirmed(self):
@@ -1443,21 +1707,24 @@ class MainWindow(QWidget):
         self.cone_zone_context_menu.propertiesConfirmed.connect(self._on_zone_properties_confirmed)
     
     def on_theme_mode_changed(self, new_mode: str):
-        """Regenerate theme given team colors and refresh the scene and settings UI."""
-        # Get primary and secondary colors
-        home_main = home_colors[home_ids[0]][0] if home_ids and home_ids[0] in home_colors else "#FFFFFF"
-        home_sec  = home_colors[home_ids[0]][1] if home_ids and home_ids[0] in home_colors and len(home_colors[home_ids[0]]) > 1 else "#CCCCCC"
-        away_main = away_colors[away_ids[0]][0] if away_ids and away_ids[0] in away_colors else "#000000"
-        away_sec  = away_colors[away_ids[0]][1] if away_ids and away_ids[0] in away_colors and len(away_colors[away_ids[0]]) > 1 else "#444444"
-        self.current_theme = self.theme_mgr.generate(new_mode, home_main, away_main, home_sec, away_sec)
+        """Apply the theme for a mode and schedule a scene refresh.
+
+        Themes are cached by ThemeManager per (mode, team colors), so after
+        the startup prewarm this is a dict hit; the redraw is coalesced with
+        any other forced refresh in the same event-loop tick.
+        """
+        self.current_theme = self.theme_mgr.generate(new_mode, *self._theme_team_colors)
         self.pitch_widget.theme = self.current_theme
         self.settings_manager.reset_theme_colors(self.current_theme)
-        current = self.timeline_widget.value()
-        self.update_scene(current)
+        self._schedule_full_refresh()
         if self.settings_dialog is not None and self.settings_dialog.isVisible():
             self.settings_dialog._load_current_settings()
 
 
+    def _schedule_full_refresh(self):
+        """Request a forced redraw of the current frame on the next event-loop pass."""
+        self._full_refresh_timer.start()
+
     def _show_settings(self):
         """Show (or focus) the non-modal Visual Settings dialog."""
         # If the dialog already exists and is visible, just raise it
@@ -1474,7 +1741,7 @@ class MainWindow(QWidget):
                 self.settings_manager.settingsChanged.disconnect(self._settings_signal_connection)
             except Exception:
                 pass
-        self._settings_signal_connection = lambda: self.update_scene(self.timeline_widget.value())
+        self._settings_signal_connection = self._schedule_full_refresh
         self.settings_manager.settingsChanged.connect(self._settings_signal_connection)
         self.settings_dialog.destroyed.connect(self._on_settings_dialog_destroyed)
         self.settings_dialog.show()
@@ -1495,6 +1762,7 @@ class MainWindow(QWidget):
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     # Ensure import order: PyQt first, then qt_material
+    import qt_material
     qt_material.apply_stylesheet(app, theme='dark_blue.xml', invert_secondary=False)
     win = MainWindow()
     win.show()
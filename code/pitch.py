@@ -12,7 +12,7 @@ from PyQt6.QtWidgets import (
     QWidget, QGraphicsScene, QGraphicsView, QVBoxLayout, QGraphicsEllipseItem, QGraphicsPathItem,
     QGraphicsTextItem, QGraphicsRectItem, QGraphicsItemGroup
 )
-from PyQt6.QtGui import QPen, QBrush, QColor, QFont, QPainterPath, QTransform
+from PyQt6.QtGui import QPen, QBrush, QColor, QFont, QPainter, QPainterPath, QTransform
 from PyQt6.QtCore import QRectF, Qt
 from config import CONFIG
 
@@ -20,6 +20,16 @@ from config import CONFIG
 from data_processing import get_pressure_color, build_ball_carrier_array
 from config import *
 
+# One record per player for `PitchWidget.draw_players_batch`
+PLAYER_RECORD_DTYPE = np.dtype([
+    ('x', 'f8'), ('y', 'f8'),
+    ('main', 'U9'), ('sec', 'U9'), ('numc', 'U9'),
+    ('number', 'U4'),
+    ('angle', 'f8'), ('velocity', 'f8'),
+    ('z', 'i4'),
+    ('arrow_color', 'U9'),
+])
+
 class PitchWidget(QWidget):
     """Graphics widget to display a soccer pitch and dynamic overlays.
 
@@ -42,12 +52,16 @@ class PitchWidget(QWidget):
 
 
         self.pitch_items = []         # Static pitch objects
+        self._pitch_colors = None     # (grass, line) colors the static pitch was built with
         self.dynamic_items = []       # Dynamic objects (players, ball, lines, etc)
+        self.overlay_items = {'offside': [], 'pressure': []}  # Current-frame overlays (also in dynamic_items)
         self.annotation_items = []    # Annotations/arrows, managed elsewhere
 
         self.scene = QGraphicsScene(self)
         self.view = QGraphicsView(self.scene)
-        self.view.setRenderHints(self.view.renderHints() | self.view.renderHints())
+        self.view.setRenderHints(self.view.renderHints() | QPainter.RenderHint.Antialiasing)
+        # Repaint only the regions of items that changed, not the whole viewport
+        self.view.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
         self.view.scale(1, -1)
         layout = QVBoxLayout(self)
         layout.addWidget(self.view)
@@ -57,6 +71,34 @@ class PitchWidget(QWidget):
     
         
 
+    def set_antialiasing(self, enabled):
+        """Enable or disable antialiased rendering of the view.
+
+        Parameters
+        ----------
+        enabled : bool
+            True for smooth edges (paused inspection), False for cheaper
+            rendering during playback.
+        """
+        self.view.setRenderHint(QPainter.RenderHint.Antialiasing, enabled)
+
+    def set_item_indexing(self, enabled):
+        """Switch the scene between BSP indexing and no indexing.
+
+        Parameters
+        ----------
+        enabled : bool
+            True for the BSP tree (depth chosen automatically), False while a
+            preview item is reshaped on every mouse move, so Qt does not
+            re-index it each time.
+        """
+        if enabled:
+            if self.scene.itemIndexMethod() != QGraphicsScene.ItemIndexMethod.BspTreeIndex:
+                self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+                self.scene.setBspTreeDepth(0)
+        else:
+            self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+
     def clear_pitch(self):
         """Remove static field items from the scene."""
         for item in self.pitch_items:
@@ -73,14 +115,48 @@ class PitchWidget(QWidget):
             except Exception:
                 pass
         self.dynamic_items.clear()
+        for items in self.overlay_items.values():
+            items.clear()
+
+    def set_overlay_visible(self, name, visible):
+        """Show or hide the items already drawn for an overlay.
+
+        Parameters
+        ----------
+        name : {'offside','pressure'}
+            Overlay key.
+        visible : bool
+            Target visibility.
+
+        Returns
+        -------
+        bool
+            True if the overlay has items for the current frame.
+        """
+        items = self.overlay_items.get(name, [])
+        for item in items:
+            item.setVisible(visible)
+        return bool(items)
 
         
-    def draw_pitch(self):
-        """Draw the field using current theme colors (grass and lines)."""
-        self.clear_pitch()
+    def draw_pitch(self, force=False):
+        """Draw the field using current theme colors (grass and lines).
+
+        Static items persist across frames; they are only rebuilt when the
+        theme's grass/line colors changed since the last build.
+
+        Parameters
+        ----------
+        force : bool, default False
+            Rebuild the static items even if the colors are unchanged.
+        """
         # Grab theme colors (fallback if key is missing)
         grass_color = self.theme.get("grass", "#08711a")
         line_color    = self.theme.get("line",    "#FFFFFF")
+        if not force and self.pitch_items and self._pitch_colors == (grass_color, line_color):
+            return
+        self._pitch_colors = (grass_color, line_color)
+        self.clear_pitch()
 
         brush = QBrush(QColor(grass_color))
         pen   = QPen(QColor(line_color), LINE_WIDTH)
@@ -362,13 +438,43 @@ class PitchWidget(QWidget):
         text.setPos(-text_rect.width()/2, +text_rect.height()/2)
         group.addToGroup(text)
         group.setPos(x, y)
-        deg = np.degrees(angle) + PLAYER_ROTATION_OFFSET_DEG if display_orientation else PLAYER_ROTATION_DEFAULT_DEG + PLAYER_ROTATION_OFFSET_DEG
+        deg = math.degrees(angle) + PLAYER_ROTATION_OFFSET_DEG if display_orientation else PLAYER_ROTATION_DEFAULT_DEG + PLAYER_ROTATION_OFFSET_DEG
         group.setRotation(deg)
         group.setZValue(z_offset)
         self.scene.addItem(group)
         self.dynamic_items.append(group)
 
 
+    def draw_players_batch(self, players, display_orientation=False):
+        """Draw many players from one structured array.
+
+        Parameters
+        ----------
+        players : numpy.ndarray
+            Structured array of dtype `PLAYER_RECORD_DTYPE`, one record per
+            player (position, colors, number, orientation, speed, z and
+            orientation arrow color).
+        display_orientation : bool, default False
+            Whether to draw orientation arrows.
+
+        Notes
+        -----
+        The records are converted to Python values in one `tolist()` call.
+        Repainting is left to the scene, which collects dirty regions and
+        updates them asynchronously.
+        """
+        for x, y, main, sec, numc, number, angle, velocity, z, arrow_color in players.tolist():
+            self.draw_player(
+                x=x, y=y,
+                main_color=main, sec_color=sec, num_color=numc,
+                number=number,
+                angle=angle,
+                velocity=velocity,
+                display_orientation=display_orientation,
+                z_offset=z,
+                arrow_color=arrow_color or None
+            )
+
     def draw_ball(self, x, y, color=None):
         """Draw the ball at (x, y).
 
@@ -428,6 +534,7 @@ class PitchWidget(QWidget):
             line = self.scene.addLine(x_offside, self.Y_MIN, x_offside, self.Y_MAX+1, pen)
             line.setZValue(199)
             self.dynamic_items.append(line)
+            self.overlay_items['offside'].append(line)
             return line
 
 
@@ -458,6 +565,7 @@ class PitchWidget(QWidget):
         ellipse.setZValue(110)
         self.scene.addItem(ellipse)
         self.dynamic_items.append(ellipse)
+        self.overlay_items['pressure'].append(ellipse)
         return ellipse
         
 
@@ -476,6 +584,7 @@ class PitchWidget(QWidget):
         ballstatus,  
         frame_number=0,
         visible=True,
+        pid_index=None,
     ):
         """Draw pressure zone around the ball carrier if ball is active.
 
@@ -505,6 +614,9 @@ class PitchWidget(QWidget):
             Global frame index.
         visible : bool, default True
             Toggle to draw or skip.
+        pid_index : dict[str, dict[str, int]] | None
+            Per-side {player_id: column} lookup; built from the ID lists when
+            omitted.
 
         Returns
         -------
@@ -538,6 +650,11 @@ class PitchWidget(QWidget):
             return None
 
         carrier_pid, carrier_side = carrier
+        if pid_index is None:
+            pid_index = {
+                "Home": {pid: i for i, pid in enumerate(home_ids)},
+                "Away": {pid: i for i, pid in enumerate(away_ids)},
+            }
 
         pressure = pressure_fn(
             ball_xy=ball_xy,
@@ -549,7 +666,8 @@ class PitchWidget(QWidget):
             dsam=dsam,
             orientations=orientations,
             half=half,
-            idx=idx
+            idx=idx,
+            pid_index=pid_index,
         )
 
         color = get_pressure_color(pressure)
@@ -557,7 +675,7 @@ class PitchWidget(QWidget):
 
         # Center on the carrier (not the ball)
         xy = xy_objects[half][carrier_side].xy[idx]
-        i = (home_ids if carrier_side=="Home" else away_ids).index(carrier_pid)
+        i = pid_index[carrier_side][carrier_pid]
         x, y = xy[2*i], xy[2*i+1]
 
         self.draw_pressure(x, y, color=color)
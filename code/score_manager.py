@@ -4,6 +4,8 @@
 Score extraction from events to display running score by frame.
 """
 
+from bisect import bisect_right
+
 from config import *
 
 class ScoreManager:
@@ -68,6 +70,19 @@ class ScoreManager:
         # Sort by frame
         self.goals.sort(key=lambda x: x['frame'])
         
+        # Running score after each goal, for binary-search lookups by frame
+        self._goal_frames = [goal['frame'] for goal in self.goals]
+        self._running_scores = [(0, 0)]
+        home_score = away_score = 0
+        for goal in self.goals:
+            team_key = goal['team_key']
+            # Try different matches for team names vs Home/Away keys
+            if team_key == "Home" or team_key == self.home_team_name:
+                home_score += 1
+            elif team_key == "Away" or team_key == self.away_team_name:
+                away_score += 1
+            self._running_scores.append((home_score, away_score))
+        
     def get_score_at_frame(self, frame):
         """Return (home_score, away_score) at the provided global frame index.
 
@@ -81,30 +96,7 @@ class ScoreManager:
         tuple[int, int]
             Home and Away scores at or before the given frame.
         """
-        home_score = 0
-        away_score = 0
-        
-        for goal in self.goals:
-            if goal['frame'] <= frame:
-                team_key = goal['team_key']
-                
-                # Try different matches for team names vs Home/Away keys
-                is_home_goal = (
-                    team_key == "Home" or 
-                    team_key == self.home_team_name
-                )
-                
-                is_away_goal = (
-                    team_key == "Away" or 
-                    team_key == self.away_team_name
-                )
-                
-                if is_home_goal:
-                    home_score += 1
-                elif is_away_goal:
-                    away_score += 1
-        
-        return home_score, away_score
+        return self._running_scores[bisect_right(self._goal_frames, frame)]
     
     def get_all_goals(self):
         """Return all parsed goals (for debugging/inspection).
@@ -7,9 +7,77 @@ computes simulated player and ball positions over a chosen interval.
 """
 
 import numpy as np
-import math
-from PyQt6.QtCore import QPointF
+from scipy.spatial import cKDTree
 from config import *
+from utils.frame_utils import group_frames_by_half
+
+# Number of per-frame player KD-trees kept for click lookups
+PLAYER_TREE_CACHE_SIZE = 256
+
+# Realistic maximum speed according to action type (m/s)
+MAX_ACTION_SPEEDS = {
+    'run': 8.0,      # 8 m/s fast run
+    'dribble': 4.0,  # 4 m/s dribbling
+    'pass': 0.0      # Passes have no player speed limit
+}
+
+# Action type per arrow style; any other style (solid) is a pass
+ACTION_TYPE_BY_STYLE = {
+    'dotted': 'run',
+    'zigzag': 'dribble',
+}
+
+
+def _arrow_progress(progress, arrow_length, interval_seconds, max_speed):
+    """Map interval progress to progress along arrows, capped by action speed.
+
+    All array arguments broadcast together, so one call can cover every
+    arrow (rows) over every frame (columns).
+
+    Parameters
+    ----------
+    progress : float or numpy.ndarray
+        Normalized progress in [0, 1] within the simulation window.
+    arrow_length : float or numpy.ndarray
+        Polyline length of the arrow(s).
+    interval_seconds : float
+        Duration of the simulation window (seconds).
+    max_speed : float or numpy.ndarray
+        Maximum speed of the action (m/s, see `MAX_ACTION_SPEEDS`); 0 means
+        no limit.
+
+    Returns
+    -------
+    numpy.ndarray
+        Progress along the arrow(s), broadcast shape of the inputs.
+    """
+    # Calculate required speed (meters per second)
+    required_speed = arrow_length / interval_seconds
+    # Player doesn't reach the end in the allotted time:
+    # he covers the distance he can at max speed
+    capped = (max_speed > 0) & (required_speed > max_speed)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        distance_covered = max_speed * interval_seconds * progress
+        capped_progress = np.minimum(distance_covered / arrow_length, 1.0)
+    return np.where(capped, capped_progress, progress)
+
+
+def _cumulative_lengths(points):
+    """Return the arc length at each vertex of a polyline.
+
+    Parameters
+    ----------
+    points : numpy.ndarray
+        Polyline vertices, shape (n_points, 2).
+
+    Returns
+    -------
+    numpy.ndarray
+        Cumulative lengths, shape (n_points,), starting at 0.
+    """
+    segments = np.diff(points, axis=0)
+    return np.concatenate([[0.0], np.cumsum(np.hypot(segments[:, 0], segments[:, 1]))])
+
 
 class TacticalSimulationManager:
     """Manage tactical associations and compute simulated trajectories.
@@ -33,16 +101,26 @@ class TacticalSimulationManager:
         self.away_ids = away_ids
         self.home_colors = home_colors
         self.away_colors = away_colors
+        # Player ID -> (side, column index), replaces list membership/index scans
+        self._player_slots = {pid: ("Away", i) for i, pid in enumerate(away_ids)}
+        self._player_slots.update({pid: ("Home", i) for i, pid in enumerate(home_ids)})
+        self._player_tree_cache = {}  # {global_frame: (cKDTree | None, [player_id, ...])}
         
         # Tactical data
-        self.tactical_arrows = []  # arrows with associated players
+        self.tactical_arrows = {}  # {arrow_id: tactical arrow dict}, in association order
         self.ball_possession_chain = []  # pass chain
         self.player_associations = {}  # {arrow_id: player_id}
         self.pass_receivers = {}  # {arrow_id: receiver_player_id} for passes
         
         # Simulated trajectories
-        self.simulated_player_positions = {}  # {player_id: [(x, y, frame), ...]}
-        self.simulated_ball_positions = []  # [(x, y, frame), ...]
+        self.simulated_player_positions = {}  # {player_id: ndarray of (x, y, frame) rows}
+        self.simulated_ball_positions = np.empty((0, 3))  # ndarray of (x, y, frame) rows
+        self._sim_total_frames = 0
+        # Real positions over the current simulation window, built lazily per player
+        self._real_window = {}  # {player_id: ndarray (window_len, 2)}
+        self._real_window_start = 0
+        self._real_window_len = 0
+        self._real_window_frames = None  # {half: (window offsets, half indices)}, shared by all players
         
     def associate_arrow_with_player(self, arrow, player_id, current_frame, xy_objects):
         """Associate a drawn arrow with a player at a given frame.
@@ -65,6 +143,9 @@ class TacticalSimulationManager:
         """
         arrow_id = id(arrow)
         self.player_associations[arrow_id] = player_id
+        # Polyline as an (n_points, 2) array, reused for length and simulation
+        points_np = np.array([(p.x(), p.y()) for p in arrow.arrow_points], dtype=np.float64).reshape(-1, 2)
+        cum_s = _cumulative_lengths(points_np)
         
         # Create the tactical_arrow object
         tactical_arrow = {
@@ -74,11 +155,13 @@ class TacticalSimulationManager:
             'action_type': self.get_action_type(arrow),
             'start_pos': arrow.arrow_points[0],
             'end_pos': arrow.arrow_points[-1],
-            'length': self.calculate_arrow_length(arrow.arrow_points),
+            'points_np': points_np,
+            'cum_s': cum_s,  # arc length at each vertex
+            'length': float(cum_s[-1]),
             'associated_frame': current_frame
         }
         
-        self.tactical_arrows.append(tactical_arrow)
+        self.tactical_arrows[arrow_id] = tactical_arrow
         
         # If it's a pass (solid), ask for receiver
         if tactical_arrow['action_type'] == 'pass':
@@ -100,7 +183,7 @@ class TacticalSimulationManager:
             True if a pending pass was updated, False otherwise.
         """
         # Find the most recent pass without a receiver
-        for tactical_arrow in reversed(self.tactical_arrows):
+        for tactical_arrow in reversed(self.tactical_arrows.values()):
             if (tactical_arrow['action_type'] == 'pass' and 
                 'receiver_id' not in tactical_arrow):
                 
@@ -131,34 +214,32 @@ class TacticalSimulationManager:
         {'pass','run','dribble'}
             Inferred action type: solid=pass, dotted=run, zigzag=dribble.
         """
+        # The style can be edited after creation, so it is mapped on every call
         if hasattr(arrow, 'arrow_style'):
-            style = arrow.arrow_style
-            if style == "dotted":
-                return 'run'  # Dotted = run
-            elif style == "zigzag":
-                return 'dribble'  # Zigzag = dribble
-            else:
-                return 'pass'  # Solid = pass
-        
-        # Fallback: inspect child items if style attribute is missing
-        if hasattr(arrow, 'childItems') and arrow.childItems():
+            return ACTION_TYPE_BY_STYLE.get(arrow.arrow_style, 'pass')
+        
+        # Fallback: inspect child items once if style attribute is missing
+        cached = getattr(arrow, '_cached_action_type', None)
+        if cached is not None:
+            return cached
+        action_type = 'pass'  # Default to pass (solid)
+        if hasattr(arrow, 'childItems'):
             for item in arrow.childItems():
                 if hasattr(item, 'pen'):
-                    pen = item.pen()
-                    if pen.style() == Qt.PenStyle.DashLine:
-                        return 'run'
+                    if item.pen().style() == Qt.PenStyle.DashLine:
+                        action_type = 'run'
                     break
-        
-        # Default to pass (solid)
-        return 'pass'
+        arrow._cached_action_type = action_type
+        return action_type
     
     def calculate_arrow_length(self, points):
         """Compute the total Euclidean length of an arrow polyline.
 
         Parameters
         ----------
-        points : list[QPointF]
-            Sequence of points forming the polyline.
+        points : list[QPointF] or numpy.ndarray
+            Sequence of points forming the polyline, or its (n_points, 2)
+            coordinate array.
 
         Returns
         -------
@@ -168,13 +249,9 @@ class TacticalSimulationManager:
         if len(points) < 2:
             return 0
         
-        total_length = 0
-        for i in range(len(points) - 1):
-            dx = points[i+1].x() - points[i].x()
-            dy = points[i+1].y() - points[i].y()
-            total_length += math.sqrt(dx*dx + dy*dy)
-        
-        return total_length
+        if not isinstance(points, np.ndarray):
+            points = np.array([(p.x(), p.y()) for p in points], dtype=np.float64)
+        return float(_cumulative_lengths(points)[-1])
     
     def calculate_simulated_trajectories(self, interval_seconds, current_frame, xy_objects, n_frames, get_frame_data_func):
         """Compute positions for players and ball over the simulation interval.
@@ -193,12 +270,17 @@ class TacticalSimulationManager:
             Function mapping global frame -> (half, half_idx, label).
         """
         self.simulated_player_positions.clear()
-        self.simulated_ball_positions.clear()
+        self.simulated_ball_positions = np.empty((0, 3))
         
         if not self.tactical_arrows:
             return
         
         total_frames = int(interval_seconds * FPS)
+        self._sim_total_frames = total_frames
+        self._real_window.clear()
+        self._real_window_start = current_frame
+        self._real_window_len = max(0, min(total_frames + 1, n_frames - current_frame))
+        self._real_window_frames = None
         ball_current_pos = None
         ball_holder = None
         
@@ -207,121 +289,72 @@ class TacticalSimulationManager:
         try:
             ball_xy = xy_objects[half]["Ball"].xy[idx]
             if len(ball_xy) >= 2 and not np.isnan(ball_xy[0]):
-                ball_current_pos = QPointF(ball_xy[0], ball_xy[1])
+                ball_current_pos = (float(ball_xy[0]), float(ball_xy[1]))
                 # Determine who has the ball initially
                 ball_holder = self._find_closest_player_to_ball(ball_current_pos, current_frame, xy_objects, get_frame_data_func)
         except (IndexError, KeyError):
             pass
         
         # Sort actions by order and timing
-        passes = [ta for ta in self.tactical_arrows if ta['action_type'] == 'pass']
-        other_actions = [ta for ta in self.tactical_arrows if ta['action_type'] in ['run', 'dribble']]
-        
-        # Calculate trajectories for each frame
-        for frame_offset in range(total_frames):
-            current_sim_frame = current_frame + frame_offset
-            progress = frame_offset / max(1, total_frames - 1)
-            
-            # Process player actions according to calculated speed
-            for tactical_arrow in self.tactical_arrows:
-                player_id = tactical_arrow['player_id']
-                action_type = tactical_arrow['action_type']
-                # Calculate player position according to arrow and required speed over full interval
-                player_pos = self._calculate_player_position_with_speed(
-                    tactical_arrow, progress, interval_seconds, current_frame, xy_objects, get_frame_data_func
-                )
-                
-                if player_id not in self.simulated_player_positions:
-                    self.simulated_player_positions[player_id] = []
-                
-                self.simulated_player_positions[player_id].append((
-                    player_pos.x(), player_pos.y(), current_sim_frame
-                ))
-            
-            # Calculate ball position with pass speed
-            if ball_current_pos and ball_holder:
-                ball_pos = self._calculate_ball_position_with_speed(
-                    ball_current_pos, ball_holder, passes, progress, interval_seconds, 
-                    current_frame, xy_objects, get_frame_data_func
-                )
-                self.simulated_ball_positions.append((
-                    ball_pos.x(), ball_pos.y(), current_sim_frame
-                ))
+        arrows = list(self.tactical_arrows.values())
+        passes = [ta for ta in arrows if ta['action_type'] == 'pass']
+        other_actions = [ta for ta in arrows if ta['action_type'] in ['run', 'dribble']]
+        
+        progress = np.arange(total_frames) / max(1, total_frames - 1)
+        sim_frames = current_frame + np.arange(total_frames)
+        
+        # Integrate every arrow over the whole window in one broadcast:
+        # (n_arrows, 1) arrow parameters against (1, total_frames) progress
+        lengths = np.array([ta['length'] for ta in arrows], dtype=float)
+        max_speeds = np.array([MAX_ACTION_SPEEDS.get(ta['action_type'], 0.0) for ta in arrows])
+        actual_progress = _arrow_progress(
+            progress[None, :], lengths[:, None], interval_seconds, max_speeds[:, None]
+        )
+        # Interpolation by arc length along each polyline, shape (n_arrows, total_frames, 2)
+        paths = np.empty((len(arrows), total_frames, 2))
+        for k, ta in enumerate(arrows):
+            s = actual_progress[k] * ta['length']
+            pts = ta['points_np']
+            paths[k, :, 0] = np.interp(s, ta['cum_s'], pts[:, 0])
+            paths[k, :, 1] = np.interp(s, ta['cum_s'], pts[:, 1])
+        
+        # A player with several arrows gets one row per arrow per frame, frame-major
+        rows_by_player = {}
+        for k, ta in enumerate(arrows):
+            rows_by_player.setdefault(ta['player_id'], []).append(k)
+        for player_id, rows in rows_by_player.items():
+            xy = paths[rows].transpose(1, 0, 2).reshape(-1, 2)
+            self.simulated_player_positions[player_id] = np.column_stack(
+                [xy, np.repeat(sim_frames, len(rows))]
+            )
+        
+        # Calculate ball position with pass speed
+        if ball_current_pos is not None and ball_holder:
+            ball_path = self._simulate_ball_path(
+                ball_current_pos, ball_holder, passes, progress, paths, interval_seconds,
+                current_frame, xy_objects, get_frame_data_func
+            )
+            self.simulated_ball_positions = np.column_stack([ball_path, sim_frames])
 
-    
-    
-    def _calculate_player_position_with_speed(self, tactical_arrow, progress, interval_seconds, current_frame, xy_objects, get_frame_data_func):
-        """Position a player along the arrow, capped by plausible action speed.
+    def _simulate_ball_path(self, initial_ball_pos, initial_holder, passes, progress, paths, interval_seconds, current_frame, xy_objects, get_frame_data_func):
+        """Compute the ball position at every simulated frame.
 
-        Parameters
-        ----------
-        tactical_arrow : dict
-            Metadata for an associated arrow (start/end, type, length).
-        progress : float
-            Normalized progress in [0, 1] within the simulation window.
-        interval_seconds : float
-            Duration of the simulation window (seconds).
-        current_frame : int
-            Global frame when the simulation starts.
-        xy_objects : dict
-            Positions structure (unused here).
-        get_frame_data_func : callable
-            Global frame -> (half, half_idx, label).
-
-        Returns
-        -------
-        PyQt5.QtCore.QPointF
-            Interpolated player position.
-        """
-        start_pos = tactical_arrow['start_pos']
-        end_pos = tactical_arrow['end_pos']
-        arrow_length = tactical_arrow['length']
-        
-        # Calculate required speed (meters per second)
-        required_speed = arrow_length / interval_seconds
-        
-        # Realistic maximum speed according to action type
-        max_speeds = {
-            'run': 8.0,      # 8 m/s fast run
-            'dribble': 4.0,  # 4 m/s dribbling
-            'pass': 0.0      # Passes have no player speed limit
-        }
-        
-        action_type = tactical_arrow['action_type']
-        
-        if action_type in max_speeds and max_speeds[action_type] > 0:
-            # Limit speed if necessary
-            max_allowed_speed = max_speeds[action_type]
-            if required_speed > max_allowed_speed:
-                # Player doesn't reach the end in the allotted time
-                # He covers the distance he can at max speed
-                distance_covered = max_allowed_speed * interval_seconds * progress
-                total_distance = arrow_length
-                actual_progress = min(distance_covered / total_distance, 1.0)
-            else:
-                actual_progress = progress
-        else:
-            # For passes, use normal progress
-            actual_progress = progress
-        
-        # Interpolation along the arrow
-        x = start_pos.x() + actual_progress * (end_pos.x() - start_pos.x())
-        y = start_pos.y() + actual_progress * (end_pos.y() - start_pos.y())
-        
-        return QPointF(x, y)
-    
-    def _calculate_ball_position_with_speed(self, initial_ball_pos, initial_holder, passes, progress, interval_seconds, current_frame, xy_objects, get_frame_data_func):
-        """Compute ball position given pass speed and receiver path.
+        Without a pass the ball follows the initial carrier. With a pass it
+        travels from passer to receiver at a realistic pass speed, then
+        follows the receiver. Only the first pass is simulated.
 
         Parameters
         ----------
-        initial_ball_pos : QPointF
+        initial_ball_pos : tuple[float, float]
         initial_holder : str
             Initial ball holder player ID.
         passes : list[dict]
             Tactical arrows marked as passes.
-        progress : float
-            Progress in [0, 1] of the overall simulation interval.
+        progress : numpy.ndarray
+            Progress in [0, 1] of each simulated frame.
+        paths : numpy.ndarray
+            Simulated arrow paths, shape (n_arrows, total_frames, 2), rows
+            ordered like `tactical_arrows`.
         interval_seconds : float
         current_frame : int
         xy_objects : dict
@@ -329,81 +362,80 @@ class TacticalSimulationManager:
 
         Returns
         -------
-        PyQt5.QtCore.QPointF
-            Ball position at current progress.
+        numpy.ndarray
+            Ball positions, shape (total_frames, 2).
         """
+        ball_path = np.empty((len(progress), 2))
+        ball_path[:] = initial_ball_pos
+        
         if not passes:
             # No pass, ball follows initial carrier
-            if initial_holder in self.simulated_player_positions:
-                positions = self.simulated_player_positions[initial_holder]
-                if positions:
-                    latest_pos = positions[-1]
-                    return QPointF(latest_pos[0], latest_pos[1])
-            return initial_ball_pos
-        
-        # Process passes in sequence according to their timing
-        current_pass = None
-        pass_start_time = 0.0
+            for step in range(len(progress)):
+                n_available = self._available_positions(initial_holder, step)
+                if n_available:
+                    ball_path[step] = self.simulated_player_positions[initial_holder][n_available - 1, :2]
+            return ball_path
         
-                    # For simplicity, process the first pass
-
+        # For simplicity, process the first pass
         first_pass = passes[0]
-        
-        if 'receiver_id' in first_pass:
-            pass_length = first_pass['length']
-            
-            # Realistic pass speed (15-25 m/s for a normal pass)
-            pass_speed = min(25.0, max(15.0, pass_length / 2.0))  # Adapted to distance
-            pass_duration = pass_length / pass_speed
-            
-            # Convert to proportion of total time
-            pass_duration_ratio = min(pass_duration / interval_seconds, 0.8)  # Max 80% of time
-            
-            if progress <= pass_duration_ratio:
+        if 'receiver_id' not in first_pass:
+            return ball_path
+        
+        # Loop invariants of the pass model
+        receiver_id = first_pass['receiver_id']
+        passer_path = paths[next(k for k, ta in enumerate(self.tactical_arrows.values()) if ta is first_pass)]
+        pass_length = first_pass['length']
+        # Realistic pass speed (15-25 m/s for a normal pass)
+        pass_speed = min(25.0, max(15.0, pass_length / 2.0))  # Adapted to distance
+        pass_duration = pass_length / pass_speed
+        # Convert to proportion of total time
+        pass_duration_ratio = min(pass_duration / interval_seconds, 0.8)  # Max 80% of time
+        
+        for step, p in enumerate(progress.tolist()):
+            rx, ry = self._get_player_position_at_progress(
+                receiver_id, p, interval_seconds, current_frame, xy_objects, get_frame_data_func, step
+            )
+            if pass_duration_ratio > 0 and p <= pass_duration_ratio:
                 # Pass in progress - interpolate between passer and receiver
-                pass_progress = progress / pass_duration_ratio
-                
-                # Passer position
-                passer_pos = self._calculate_player_position_with_speed(
-                    first_pass, progress, interval_seconds, current_frame, xy_objects, get_frame_data_func
-                )
-                
-                # Receiver position
-                receiver_pos = self._get_player_position_at_progress(
-                    first_pass['receiver_id'], progress, interval_seconds, current_frame, xy_objects, get_frame_data_func
-                )
-                
-                # Interpolate ball with slightly curved trajectory
-                x = passer_pos.x() + pass_progress * (receiver_pos.x() - passer_pos.x())
-                y = passer_pos.y() + pass_progress * (receiver_pos.y() - passer_pos.y())
-                
-                return QPointF(x, y)
+                pass_progress = p / pass_duration_ratio
+                px, py = passer_path[step]
+                ball_path[step] = (px + pass_progress * (rx - px), py + pass_progress * (ry - py))
             else:
                 # Pass completed - ball follows receiver
-                receiver_pos = self._get_player_position_at_progress(
-                    first_pass['receiver_id'], progress, interval_seconds, current_frame, xy_objects, get_frame_data_func
-                )
-                return receiver_pos
-        
-        return initial_ball_pos
+                ball_path[step] = (rx, ry)
+        return ball_path
+
+    def _available_positions(self, player_id, step=None):
+        """Return how many simulated positions of a player exist up to `step`.
+
+        Positions hold one entry per associated arrow per frame, so frames
+        ``0..step`` cover ``n_arrows * (step + 1)`` entries. A `step` of None
+        counts the whole list.
+        """
+        positions = self.simulated_player_positions.get(player_id)
+        if positions is None or len(positions) == 0:
+            return 0
+        if step is None:
+            return len(positions)
+        per_step = max(1, len(positions) // max(1, self._sim_total_frames))
+        return min(len(positions), per_step * (step + 1))
     
-    def _get_player_position_at_progress(self, player_id, progress, interval_seconds, current_frame, xy_objects, get_frame_data_func):
+    def _get_player_position_at_progress(self, player_id, progress, interval_seconds, current_frame, xy_objects, get_frame_data_func, step=None):
         """Return simulated or real player position at a given progress ratio.
 
         Returns
         -------
-        PyQt5.QtCore.QPointF
+        tuple[float, float]
             Player position.
         """
         # First check if there's a simulated position
-        if player_id in self.simulated_player_positions:
-            positions = self.simulated_player_positions[player_id]
-            if positions:
-                # Take position corresponding to progress
-                target_index = int(progress * (len(positions) - 1))
-                target_index = min(target_index, len(positions) - 1)
-                latest_pos = positions[target_index]
-                return QPointF(latest_pos[0], latest_pos[1])
+        n_available = self._available_positions(player_id, step)
+        if n_available:
+            # Take position corresponding to progress
+            target_index = int(progress * (n_available - 1))
+            target_index = min(target_index, n_available - 1)
+            latest_pos = self.simulated_player_positions[player_id][target_index]
+            return latest_pos[0], latest_pos[1]
         
         # Otherwise, use real position
         frame_to_check = current_frame + int(progress * interval_seconds * FPS)
@@ -414,52 +446,96 @@ class TacticalSimulationManager:
 
         Returns
         -------
-        PyQt5.QtCore.QPointF
+        tuple[float, float]
             Player position; (0, 0) if unavailable.
         """
+        # Inside the simulation window: plain array read
+        offset = frame - self._real_window_start
+        if 0 <= offset < self._real_window_len:
+            window = self._real_window.get(player_id)
+            if window is None:
+                window = self._build_real_window(player_id, xy_objects, get_frame_data_func)
+            x, y = window[offset]
+            return x, y
+        
         half, idx, _ = get_frame_data_func(frame)
         
-        # Determine player's team
-        side = "Home" if player_id in self.home_ids else "Away"
-        ids = self.home_ids if side == "Home" else self.away_ids
+        # Determine player's team and column
+        slot = self._player_slots.get(player_id)
+        if slot is None:
+            return 0.0, 0.0
+        side, player_index = slot
         
         try:
-            player_index = ids.index(player_id)
             xy = xy_objects[half][side].xy[idx]
             
             if 2*player_index+1 < len(xy):
                 x, y = xy[2*player_index], xy[2*player_index+1]
                 if not np.isnan(x) and not np.isnan(y):
-                    return QPointF(x, y)
-        except (ValueError, IndexError, KeyError):
+                    return x, y
+        except (IndexError, KeyError):
             pass
         
-        return QPointF(0, 0)  # Default position
+        return 0.0, 0.0  # Default position
+    
+    def _build_real_window(self, player_id, xy_objects, get_frame_data_func):
+        """Gather a player's real positions over the simulation window.
+
+        Returns
+        -------
+        numpy.ndarray
+            Shape (window_len, 2); (0, 0) where the position is unavailable,
+            matching `_get_real_player_position`.
+        """
+        window = np.zeros((self._real_window_len, 2))
+        slot = self._player_slots.get(player_id)
+        if slot is not None:
+            side, i = slot
+            for half, (ks, idxs) in self._window_frames(get_frame_data_func).items():
+                try:
+                    xy = xy_objects[half][side].xy[idxs]
+                except (IndexError, KeyError):
+                    continue
+                if 2*i+1 >= xy.shape[1]:
+                    continue
+                pts = xy[:, 2*i:2*i+2]
+                ok = ~np.isnan(pts).any(axis=1)
+                window[ks[ok]] = pts[ok]
+        self._real_window[player_id] = window
+        return window
+    
+    def _window_frames(self, get_frame_data_func):
+        """Resolve every frame of the simulation window to its half and index.
+
+        Computed once per simulation and shared by all players.
+
+        Returns
+        -------
+        dict[str, tuple[numpy.ndarray, numpy.ndarray]]
+            {half: (window offsets, indices within the half)}.
+        """
+        if self._real_window_frames is None:
+            self._real_window_frames = group_frames_by_half(
+                self._real_window_start + np.arange(self._real_window_len), get_frame_data_func
+            )
+        return self._real_window_frames
     
     def _find_closest_player_to_ball(self, ball_pos, frame, xy_objects, get_frame_data_func):
         """Find the player closest to the ball at a frame.
 
+        Uses the cached per-frame player KD-tree (see `_player_tree`), so
+        repeated possession lookups on the same frame are O(log P).
+
         Returns
         -------
         str | None
             Player ID or None if not found.
         """
-        min_distance = float('inf')
-        closest_player = None
-        
-        for side, ids in [("Home", self.home_ids), ("Away", self.away_ids)]:
-            for player_id in ids:
-                player_pos = self._get_real_player_position(player_id, frame, xy_objects, get_frame_data_func)
-                distance = math.sqrt(
-                    (ball_pos.x() - player_pos.x())**2 + 
-                    (ball_pos.y() - player_pos.y())**2
-                )
-                
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_player = player_id
-        
-        return closest_player
+        tree, tree_ids = self._player_tree(frame, xy_objects, get_frame_data_func)
+        if tree is None:
+            return None
+        _, k = tree.query(ball_pos, k=1)
+        return tree_ids[k]
     
     def find_player_at_position(self, click_pos, current_frame, xy_objects, get_frame_data_func, max_distance=PLAYER_OUTER_RADIUS_BASE):
         """Find the nearest player to an arbitrary click within a threshold.
@@ -477,22 +553,49 @@ class TacticalSimulationManager:
         str | None
             Closest player ID within threshold, else None.
         """
-        min_distance = float('inf')
-        closest_player = None
+        tree, tree_ids = self._player_tree(current_frame, xy_objects, get_frame_data_func)
+        if tree is None:
+            return None
+        distance, k = tree.query((click_pos.x(), click_pos.y()), k=1, distance_upper_bound=max_distance)
+        if not np.isfinite(distance):
+            return None
+        return tree_ids[k]
+    
+    def _player_tree(self, frame, xy_objects, get_frame_data_func):
+        """Return a KD-tree over the on-pitch players at a global frame.
+
+        Trees are built lazily and kept for the last
+        `PLAYER_TREE_CACHE_SIZE` frames queried.
+
+        Returns
+        -------
+        tuple[scipy.spatial.cKDTree | None, list[str]]
+            Tree over player positions (None if nobody is on the pitch) and
+            the player ID of each tree point.
+        """
+        cached = self._player_tree_cache.get(frame)
+        if cached is not None:
+            return cached
         
+        half, idx, _ = get_frame_data_func(frame)
+        points, tree_ids = [], []
         for side, ids in [("Home", self.home_ids), ("Away", self.away_ids)]:
-            for player_id in ids:
-                player_pos = self._get_real_player_position(player_id, current_frame, xy_objects, get_frame_data_func)
-                distance = math.sqrt(
-                    (click_pos.x() - player_pos.x())**2 + 
-                    (click_pos.y() - player_pos.y())**2
-                )
-                
-                if distance < min_distance and distance <= max_distance:
-                    min_distance = distance
-                    closest_player = player_id
-        
-        return closest_player
+            try:
+                xy = xy_objects[half][side].xy[idx]
+            except (IndexError, KeyError):
+                continue
+            n = min(len(ids), len(xy) // 2)
+            xy_r = xy[:2*n].reshape(-1, 2)
+            valid = np.flatnonzero(~np.isnan(xy_r).any(axis=1))
+            points.append(xy_r[valid])
+            tree_ids.extend(ids[i] for i in valid)
+        
+        tree = cKDTree(np.concatenate(points)) if tree_ids else None
+        if len(self._player_tree_cache) >= PLAYER_TREE_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            self._player_tree_cache.pop(next(iter(self._player_tree_cache)))
+        self._player_tree_cache[frame] = (tree, tree_ids)
+        return tree, tree_ids
     
     def clear_tactical_data(self):
         """Reset tactical associations and all simulated positions."""
@@ -501,7 +604,7 @@ class TacticalSimulationManager:
         self.player_associations.clear()
         self.pass_receivers.clear()
         self.simulated_player_positions.clear()
-        self.simulated_ball_positions.clear()
+        self.simulated_ball_positions = np.empty((0, 3))
     
     def get_simulated_trajectories(self):
         """Return simulated player and ball trajectories for rendering.
@@ -509,7 +612,8 @@ class TacticalSimulationManager:
         Returns
         -------
         dict
-            {'players': dict, 'ball': list}
+            {'players': {player_id: ndarray of (x, y, frame) rows},
+             'ball': ndarray of (x, y, frame) rows}
         """
         return {
             'players': self.simulated_player_positions,
@@ -524,15 +628,10 @@ class TacticalSimulationManager:
         list
             Arrow items not in the associated set.
         """
-        associated_arrow_ids = {ta['arrow_id'] for ta in self.tactical_arrows}
-        all_arrows = self.annotation_manager.arrows
-        
-        non_associated = []
-        for arrow in all_arrows:
-            if id(arrow) not in associated_arrow_ids:
-                non_associated.append(arrow)
-        
-        return non_associated
+        # player_associations is keyed by the ids of associated arrows and kept
+        # in sync on associate/remove/clear, so it doubles as the id set
+        associated_arrow_ids = self.player_associations
+        return [arrow for arrow in self.annotation_manager.arrows if id(arrow) not in associated_arrow_ids]
     
     def get_associated_arrows(self):
         """Return a copy of associated arrows with their tactical metadata.
@@ -540,9 +639,9 @@ class TacticalSimulationManager:
         Returns
         -------
         list[dict]
-            Shallow copy of internal tactical arrows list.
+            Tactical arrows in association order.
         """
-        return self.tactical_arrows.copy()
+        return list(self.tactical_arrows.values())
     
     def remove_arrow_association(self, arrow):
         """Remove association for the specified arrow and clean related state.
@@ -555,7 +654,7 @@ class TacticalSimulationManager:
         arrow_id = id(arrow)
         
         # Remove from tactical_arrows
-        self.tactical_arrows = [ta for ta in self.tactical_arrows if ta['arrow_id'] != arrow_id]
+        self.tactical_arrows.pop(arrow_id, None)
         
         # Remove associations
         if arrow_id in self.player_associations:
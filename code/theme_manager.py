@@ -9,7 +9,8 @@ Generates two modes:
   hues for offside and arrow to pop out
 """
 from typing import Dict
-from utils.color_utils import hex_to_lab, delta_e_lab, lch_to_hex, contrast_ratio, hex_to_lch, hex_to_rgb, relative_luminance
+import numpy as np
+from utils.color_utils import hex_to_lab, delta_e_matrix, lch_to_hex, lch_to_lab_d65, lch_in_srgb_gamut, hex_to_lch, hex_luminance
 from config import BALL_COLOR
 
 # Fallback: [grass, line, offside, arrow]
@@ -20,6 +21,9 @@ BW_GRASS_IF_LIGHT = "#292929"
 BW_GRASS_IF_DARK = "#E4E4E4"
 BW_LINE_IF_LIGHT = "#E4E4E4"
 BW_LINE_IF_DARK = "#292929"
+# Upper bound of (ΔE00 / ΔE76)^2: S_L, S_C, S_H >= 1, a' <= 1.5 a and
+# |R_T| <= 2 give ΔE00^2 <= ΔL^2 + 2 (2.25 Δa^2 + Δb^2) <= 4.5 ΔE76^2
+DE00_DE76_RATIO_SQ = 4.5
 
 def is_light(hexcolor):
     """Return True if a hex color is considered light.
@@ -53,6 +57,45 @@ def majority_light(colors):
     lights = sum(is_light(c) for c in colors)
     return lights >= 2  # majority out of 4
 
+def _score_candidates(cand_lums, cand_hues, ref_lums, ref_hues):
+    """Score candidate colors and pick the best one.
+
+    Parameters
+    ----------
+    cand_lums, cand_hues : array-like
+        Relative luminance and LCH hue (degrees) of each candidate, shape (N,).
+    ref_lums : array-like
+        Luminances the candidate must contrast with, shape (R,).
+    ref_hues : array-like
+        Hues the candidate must stay away from, shape (H,).
+
+    Returns
+    -------
+    tuple[int, float]
+        Index of the best candidate (first one on ties) and its score, or
+        (-1, -1.0) if no candidate passes the contrast and hue filters.
+    """
+    cand_lums = np.asarray(cand_lums, dtype=float)
+    ref_lums = np.asarray(ref_lums, dtype=float)
+    if not len(cand_lums) or not len(ref_lums):
+        return -1, -1.0
+    # Contrast ratios, shape (N, R)
+    lum = cand_lums[:, None]
+    contrasts = (np.maximum(lum, ref_lums) + 0.05) / (np.minimum(lum, ref_lums) + 0.05)
+    min_cr = contrasts.min(axis=1)
+    score = min_cr + 0.2 * contrasts.mean(axis=1)
+    valid = min_cr >= 1.2  # relaxed threshold for visibility
+    ref_hues = np.asarray(ref_hues, dtype=float)
+    if len(ref_hues):
+        hue_diff = np.abs(np.asarray(cand_hues, dtype=float)[:, None] - ref_hues)
+        hue_diff = np.minimum(hue_diff, 360 - hue_diff)  # handle wrap-around
+        valid &= hue_diff.min(axis=1) >= 60  # minimum 60° hue separation
+    if not valid.any():
+        return -1, -1.0
+    score = np.where(valid, score, -np.inf)
+    best = int(np.argmax(score))
+    return best, float(score[best])
+
 class ThemeManager:
     """Produce color themes ensuring contrast and distinct hues.
 
@@ -65,6 +108,9 @@ class ThemeManager:
         self.de_min = de_min
         # Cache computed themes to avoid recomputation when switching
         self._cache: Dict[tuple, Dict[str, str]] = {}
+        # Cache single color searches, shared across modes and themes; keys hold
+        # every search input, so entries never go stale
+        self._color_cache: Dict[tuple, str] = {}
 
     def fallback(self) -> Dict[str, str]:
         """Return a conservative, always-valid theme as a safety net.
@@ -100,8 +146,10 @@ class ThemeManager:
         ball = BALL_COLOR
         mode_upper = mode.upper()
 
-        # Cache key per mode and team colors
-        cache_key = (mode_upper, home, away, home_sec, away_sec)
+        # Cache key per mode and team colors. Every filter and score in
+        # `_find_distinct_color` is order-independent over the references, so
+        # the colors are keyed as a sorted multiset: swapped kits share a theme
+        cache_key = (mode_upper, tuple(sorted(all_teams)))
         if cache_key in self._cache:
             return self._cache[cache_key]
 
@@ -208,15 +256,25 @@ class ThemeManager:
         """
         # Normalize reference list to valid hex strings
         refs = [c for c in reference_colors if isinstance(c, str) and c.startswith("#") and len(c) == 7]
+        # The search is order-independent over the references
+        cache_key = (tuple(sorted(refs)), chroma, luminance, grass, line, de_threshold)
+        cached = self._color_cache.get(cache_key)
+        if cached is not None:
+            return cached
         forbidden_labs = [hex_to_lab(c) for c in refs]
+        ref_labs = np.array(forbidden_labs, dtype=float).reshape(-1, 3)
+        # Reference hues and luminances are fixed for the whole search
+        ref_hues = [hex_to_lch(c)[2] for c in refs]
+        contrast_refs = [c for c in (grass, line) if c]
+        contrast_refs += [c for c in refs if c != grass and c != line]
+        ref_lums = [hex_luminance(c) for c in contrast_refs]
 
         best = None
-        best_score = -1.0
 
         # Adjust luminance range based on grass color
         if grass and isinstance(luminance, tuple):
             lmin, lmax = luminance
-            grass_luminance = relative_luminance(hex_to_rgb(grass))
+            grass_luminance = hex_luminance(grass)
             
             # If grass is light (white-ish), prefer dark colors
             if grass_luminance > 0.7:
@@ -239,69 +297,46 @@ class ThemeManager:
         else:
             C_trials = [float(chroma)]
 
+        tried_hues = set()
         for step in [53, 31, 19, 11, 7]:
-            candidates = []
-            for L in L_trials:
-                for C in C_trials:
-                    for h in range(0, 360, step):
-                        c_hex = lch_to_hex(L, C, h)
-                        if c_hex:
-                            candidates.append(c_hex)
-            candidates = [c for c in candidates if c]
-            for c in candidates:
-                # ΔE filter against all references
-                c_lab = hex_to_lab(c)
-                min_de = min(delta_e_lab(c_lab, lab) for lab in forbidden_labs) if forbidden_labs else 1e9
-                if min_de <= de_threshold:
-                    continue
-                
-                # Step 1: Contrast filter - check if minimum contrast is acceptable
-                contrasts = []
-                if grass:
-                    contrasts.append(contrast_ratio(c, grass))
-                if line:
-                    contrasts.append(contrast_ratio(c, line))
-                for ref_hex in refs:
-                    if grass and ref_hex == grass:
-                        continue
-                    if line and ref_hex == line:
-                        continue
-                    contrasts.append(contrast_ratio(c, ref_hex))
-                if not contrasts:
-                    continue
-                
-                min_cr = min(contrasts)
-                avg_cr = sum(contrasts) / len(contrasts)
-                
-                # Reject if minimum contrast is too low
-                if min_cr < 1.2:  # relaxed threshold for visibility
-                    continue
-                
-                # Step 2: Hue difference filter - check if hue is sufficiently different
-                c_lch = hex_to_lch(c)
-                c_hue = c_lch[2]
-                min_hue_diff = 360.0
-                for ref_hex in refs:
-                    ref_lch = hex_to_lch(ref_hex)
-                    ref_hue = ref_lch[2]
-                    hue_diff = abs(c_hue - ref_hue)
-                    hue_diff = min(hue_diff, 360 - hue_diff)  # handle wrap-around
-                    min_hue_diff = min(min_hue_diff, hue_diff)
-                
-                # Reject if hue is too similar to any forbidden color
-                if min_hue_diff < 60:  # minimum 60° hue separation
-                    continue
-                
-                # If we reach here, the color passes both filters
-                # Score based on contrast quality (higher is better)
-                score = min_cr + 0.2 * avg_cr 
-                if score > best_score:
-                    best_score = score
-                    best = c
-
+            # A finer step is only reached when every coarser candidate failed,
+            # so hues already on a coarser grid are skipped
+            hues = [h for h in range(0, 360, step) if h not in tried_hues]
+            tried_hues.update(hues)
+            grid = np.array(
+                [(L, C, h) for L in L_trials for C in C_trials for h in hues], dtype=float
+            )
+            # Out-of-gamut points would make lch_to_hex return None: drop them first
+            grid = grid[lch_in_srgb_gamut(grid)]
+            # ΔE filter against all references, one batch for the whole grid.
+            # Candidates are taken to Lab in the D65 white of the hex_to_lab
+            # references directly, without an sRGB hex round-trip
+            if forbidden_labs:
+                labs = lch_to_lab_d65(grid)
+                # Cheap squared CIE76 gate: candidates this close to a reference
+                # are certain to fail the ΔE00 test, which only runs on the rest
+                de76_sq = ((labs[:, None, :] - ref_labs[None, :, :]) ** 2).sum(axis=2).min(axis=1)
+                keep = de76_sq * DE00_DE76_RATIO_SQ > de_threshold ** 2
+                if keep.any():
+                    keep[keep] = delta_e_matrix(labs[keep], forbidden_labs).min(axis=1) > de_threshold
+                passed = grid[keep]
+            else:
+                passed = grid
+            # Only ΔE survivors are converted to sRGB hex
+            cand_hex = [c for c in (lch_to_hex(L, C, h) for L, C, h in passed.tolist()) if c]
+            idx, _ = _score_candidates(
+                [hex_luminance(c) for c in cand_hex],
+                [hex_to_lch(c)[2] for c in cand_hex],
+                ref_lums,
+                ref_hues,
+            )
+            if idx >= 0:
+                best = cand_hex[idx]
 
             if best is not None:
-                return best
+                break
 
         # Nothing passed; pick vivid fallback
-        return best if best else FALLBACK[2]
+        result = best if best else FALLBACK[2]
+        self._color_cache[cache_key] = result
+        return result
@@ -6,11 +6,64 @@ Trajectory computation and rendering for players and ball.
 with temporal fading so upcoming segments are more visible than distant ones.
 """
 
-from PyQt6.QtGui import QPen, QColor, QBrush
+from PyQt6.QtGui import QPen, QColor, QBrush, QPainterPath
 from PyQt6.QtCore import Qt
-from collections import deque
 import numpy as np
 from config import *
+from utils.frame_utils import group_frames_by_half
+
+def _segment_alphas(start_frames, current_frame, fade_frames, min_alpha, fade_span, static_alpha):
+    """Compute the opacity of trajectory segments and which ones to draw.
+
+    Parameters
+    ----------
+    start_frames : numpy.ndarray
+        Global frame at the start of each segment.
+    current_frame : int or None
+        Playback frame; None disables the time-based fade.
+    fade_frames : int
+        Horizon (frames) over which opacity drops from 1 to `min_alpha`.
+    min_alpha, fade_span : float
+        Opacity floor and total opacity lost over the horizon.
+    static_alpha : float
+        Opacity used when `current_frame` is None or the horizon is empty.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        Per-segment alpha and boolean mask of segments to draw (past
+        segments are hidden while fading is enabled).
+    """
+    n = len(start_frames)
+    if not TRAJECTORY_FADING:
+        return np.ones(n), np.ones(n, dtype=bool)
+    drawn = np.ones(n, dtype=bool) if current_frame is None else start_frames >= current_frame
+    if current_frame is None or fade_frames <= 0:
+        return np.full(n, static_alpha), drawn
+    distance_factor = (start_frames - current_frame) / fade_frames
+    return np.maximum(min_alpha, 1.0 - distance_factor * fade_span), drawn
+
+
+def _first_future_segment(start_frames, current_frame):
+    """Index of the first segment that `_segment_alphas` would draw.
+
+    Parameters
+    ----------
+    start_frames : numpy.ndarray
+        Global frame at the start of each segment, non-decreasing.
+    current_frame : int or None
+        Playback frame.
+
+    Returns
+    -------
+    int
+        0 when nothing is hidden; ``len(start_frames)`` when the whole track
+        is already in the past.
+    """
+    if not TRAJECTORY_FADING or current_frame is None:
+        return 0
+    return int(np.searchsorted(start_frames, current_frame, side='left'))
+
 
 class TrajectoryManager:
     """Manage drawing of future and simulated trajectories for players/ball.
@@ -25,22 +78,46 @@ class TrajectoryManager:
 
     def __init__(self, pitch_widget, home_colors, away_colors):
         self.pitch_widget = pitch_widget
-        self.player_trails = {}
         self.future_trajectories = {}
         self.cached_frame = None  # Cache to avoid recomputing
         self.cached_interval = None
         self.home_colors = home_colors
         self.away_colors = away_colors
         self.simulated_trajectories = {}  # Tactical simulated trajectories
+        # Path items are recycled across frames instead of being re-created:
+        # the first `_pool_used` are drawn this frame, `_pool_shown` were visible
+        self._path_pool = []
+        self._pool_used = 0
+        self._pool_shown = 0
+        # Parsed QColor per hex string; callers copy before changing the alpha
+        self._qcolor_cache = {}
         
     def clear_trails(self):
         """Clear cached and drawn trajectories from the scene."""
-        self.player_trails.clear()
+        self.begin_frame()
+        self.end_frame()
         self.future_trajectories.clear()
         self.simulated_trajectories.clear()
         self.cached_frame = None
         self.cached_interval = None
         
+    def begin_frame(self):
+        """Start a redraw: pooled path items become available again."""
+        self._pool_used = 0
+
+    def end_frame(self):
+        """Finish a redraw: hide pooled path items not reused this frame."""
+        for item in self._path_pool[self._pool_used:self._pool_shown]:
+            item.setVisible(False)
+        self._pool_shown = self._pool_used
+
+    def _qcolor(self, hex_color):
+        """Return the cached QColor parsed from `hex_color` (do not mutate)."""
+        color = self._qcolor_cache.get(hex_color)
+        if color is None:
+            color = self._qcolor_cache[hex_color] = QColor(hex_color)
+        return color
+
     def calculate_future_trajectories(self, current_frame, interval_seconds, xy_objects, 
                                     home_ids, away_ids, n_frames, get_frame_data_func):
         """Compute future positions for players/ball for the given interval.
@@ -62,8 +139,9 @@ class TrajectoryManager:
 
         Notes
         -----
-        Uses a sampling step (``CONFIG.TRAJECTORY_SAMPLE_RATE``) and caches
-        results for the same (frame, interval) pair to avoid recomputation.
+        Uses a sampling step (``TRAJECTORY_SAMPLE_RATE``, which is also the
+        drawn resolution) and caches results for the same (frame, interval)
+        pair to avoid recomputation.
         """
         # Optimization: cache to avoid recomputing for the same (frame, interval)
         if (self.cached_frame == current_frame and 
@@ -74,41 +152,51 @@ class TrajectoryManager:
         future_frames = int(interval_seconds * FPS)
         end_frame = min(current_frame + future_frames, n_frames - 1)
         
-        self.future_trajectories = {
-            'players': {'Home': {}, 'Away': {}},
-            'ball': []
-        }
-        
         # Optimization: sample to reduce the number of points drawn
         sample_step = TRAJECTORY_SAMPLE_RATE
         
-        for frame in range(current_frame, end_frame + 1, sample_step):
-            half, idx, _ = get_frame_data_func(frame)
-            progress = (frame - current_frame) / max(1, future_frames)
+        frames = np.arange(current_frame, end_frame + 1, sample_step)
+        progress = (frames - current_frame) / max(1, future_frames)
+        
+        # Each half is gathered with one fancy-indexing call per side; rows
+        # are (x, y, progress, frame), the frame being kept for comparison
+        # against current_frame when drawing. Finished tracks are stored
+        # column-wise, shape (4, n), so each field is one contiguous array
+        player_chunks = {'Home': {}, 'Away': {}}
+        ball_chunks = []
+        for half, (ks, idxs) in group_frames_by_half(frames, get_frame_data_func).items():
+            fp = np.column_stack([progress[ks], frames[ks]])
             
             # Players
             for side, ids in [("Home", home_ids), ("Away", away_ids)]:
                 try:
-                    xy = xy_objects[half][side].xy[idx]
-                    for i, pid in enumerate(ids):
-                        if 2*i+1 < len(xy):  # Bounds check
-                            x, y = xy[2*i], xy[2*i+1]
-                            if not np.isnan(x) and not np.isnan(y):
-                                if pid not in self.future_trajectories['players'][side]:
-                                    self.future_trajectories['players'][side][pid] = []
-                                # Also store the frame for comparison against current_frame
-                                self.future_trajectories['players'][side][pid].append((x, y, progress, frame))
+                    xy = xy_objects[half][side].xy[idxs]
                 except (IndexError, KeyError):
                     continue
+                n = min(len(ids), xy.shape[1] // 2)  # Bounds check
+                xy = xy[:, :2*n].reshape(len(idxs), n, 2)
+                valid = ~np.isnan(xy).any(axis=2)
+                chunks = player_chunks[side]
+                for i in np.flatnonzero(valid.any(axis=0)).tolist():
+                    rows = valid[:, i]
+                    chunks.setdefault(ids[i], []).append(np.column_stack([xy[rows, i], fp[rows]]))
             
             # Ball
             try:
-                ball_xy = xy_objects[half]["Ball"].xy[idx]
-                if len(ball_xy) >= 2 and not np.isnan(ball_xy[0]):
-                    # Also store the frame for the ball
-                    self.future_trajectories['ball'].append((ball_xy[0], ball_xy[1], progress, frame))
+                ball_xy = xy_objects[half]["Ball"].xy[idxs]
             except (IndexError, KeyError):
                 continue
+            if ball_xy.ndim == 2 and ball_xy.shape[1] >= 2:
+                rows = ~np.isnan(ball_xy[:, 0])
+                ball_chunks.append(np.column_stack([ball_xy[rows, :2], fp[rows]]))
+        
+        self.future_trajectories = {
+            'players': {
+                side: {pid: np.concatenate(parts).T.copy() for pid, parts in chunks.items()}
+                for side, chunks in player_chunks.items()
+            },
+            'ball': np.concatenate(ball_chunks).T.copy() if ball_chunks else np.empty((4, 0)),
+        }
         
         # Update cache
         self.cached_frame = current_frame
@@ -137,94 +225,41 @@ class TrajectoryManager:
         fade_frames_ball = int(interval_seconds * FPS)     # same for the ball
         
         if show_players:
+            # One pen for all players, recolored per path (addPath copies the pen)
+            pen = QPen()
+            pen.setWidthF(CONFIG.TRAJECTORY_PLAYER_LINE_WIDTH)
+            pen.setStyle(Qt.PenStyle.CustomDashLine)  # Very thin dashed line
+            pen.setDashPattern([1, 4])
+            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
             for side, players in self.future_trajectories.get('players', {}).items():
-                for pid, positions in players.items():
-                    base_color = self.home_colors[pid][0] if side == "Home" else self.away_colors[pid][0]
-                    if len(positions) > 1:
-                        sampled_positions = positions[::2]
-                        
-                        for i in range(len(sampled_positions) - 1):
-                            x1, y1, p1, frame1 = sampled_positions[i]
-                            x2, y2, p2, frame2 = sampled_positions[i+1]
-                            
-                            # Draw only future segments unless fading is disabled
-                            if CONFIG and getattr(CONFIG, '__class__', None):
-                                fading_enabled = True if 'TRAJECTORY_FADING' not in globals() else TRAJECTORY_FADING
-                            else:
-                                fading_enabled = True
-                            if fading_enabled:
-                                if current_frame is not None and current_frame > frame1:
-                                    continue
-                            
-                            # Inverted alpha logic
-                            color = QColor(base_color)
-                            if 'TRAJECTORY_FADING' in globals() and not TRAJECTORY_FADING:
-                                final_alpha = 1.0
-                            else:
-                                if current_frame is not None:
-                                    frames_until_segment = frame1 - current_frame
-                                    # Closer segments are more opaque (~1.0)
-                                    # Farther segments are more transparent (~0.2)
-                                    distance_factor = frames_until_segment / fade_frames_players
-                                    # Inverted mapping: near -> opaque, far -> transparent
-                                    final_alpha = max(0.2, 1.0 - distance_factor * 0.8)
-                                else:
-                                    final_alpha = 0.8
-                            
-                            color.setAlphaF(final_alpha)
-                            
-                            # Very thin dashed line
-                            pen = QPen(color, CONFIG.TRAJECTORY_PLAYER_LINE_WIDTH)
-                            pen.setStyle(Qt.PenStyle.CustomDashLine)
-                            pen.setDashPattern([1, 4])
-                            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-                            
-                            line = self.pitch_widget.scene.addLine(x1, y1, x2, y2, pen)
-                            line.setZValue(8)
-                            self.pitch_widget.dynamic_items.append(line)
+                team_colors = self.home_colors if side == "Home" else self.away_colors
+                for pid, (xs, ys, _, frames) in players.items():
+                    # Skip the segments playback has already passed; stale
+                    # tracks are left with a single vertex and skipped whole
+                    first = _first_future_segment(frames[:-1], current_frame)
+                    if len(frames) - first <= 1:
+                        continue
+                    color = QColor(self._qcolor(team_colors[pid][0]))
+                    # Closer segments are more opaque (~1.0), farther ones more transparent (~0.2)
+                    alphas, drawn = _segment_alphas(frames[first:-1], current_frame, fade_frames_players, 0.2, 0.8, 0.8)
+                    self._add_segment_paths(xs[first:], ys[first:], alphas, drawn, color, pen, 8)
         
         if show_ball:
-            ball_positions = self.future_trajectories.get('ball', [])
-            if len(ball_positions) > 1:
-                sampled_ball_positions = ball_positions[::2]
-                
-                for i in range(len(sampled_ball_positions) - 1):
-                    x1, y1, p1, frame1 = sampled_ball_positions[i]
-                    x2, y2, p2, frame2 = sampled_ball_positions[i+1]
-                    
-                    # Only draw future segments unless fading is disabled
-                    if 'TRAJECTORY_FADING' in globals() and TRAJECTORY_FADING:
-                        if current_frame is not None and current_frame > frame1:
-                            continue
-                    
-                    # Same inverted alpha logic for the ball
-                    color = QColor(ball_color)
-                    if 'TRAJECTORY_FADING' in globals() and not TRAJECTORY_FADING:
-                        final_alpha = 1.0
-                    else:
-                        if current_frame is not None:
-                            frames_until_segment = frame1 - current_frame
-                            # Closer segments are more opaque (~1.0)
-                            # Farther segments are more transparent (~0.3)
-                            distance_factor = frames_until_segment / fade_frames_ball
-                            # Inverted mapping: near -> opaque, far -> transparent
-                            final_alpha = max(0.3, 1.0 - distance_factor * 0.7)
-                        else:
-                            final_alpha = 0.9
-                    
-                    color.setAlphaF(final_alpha)
-                    
-                    pen = QPen(color, CONFIG.TRAJECTORY_BALL_LINE_WIDTH)
+            xs, ys, _, frames = self.future_trajectories.get('ball', np.empty((4, 0)))
+            if len(frames) > 1:
+                first = _first_future_segment(frames[:-1], current_frame)
+                if len(frames) - first > 1:
+                    # Same inverted alpha logic for the ball, fading down to ~0.3
+                    alphas, drawn = _segment_alphas(frames[first:-1], current_frame, fade_frames_ball, 0.3, 0.7, 0.9)
+                    pen = QPen()
+                    pen.setWidthF(CONFIG.TRAJECTORY_BALL_LINE_WIDTH)
                     pen.setStyle(TRAJECTORY_STYLE)
                     pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-                    
-                    line = self.pitch_widget.scene.addLine(x1, y1, x2, y2, pen)
-                    line.setZValue(95)
-                    self.pitch_widget.dynamic_items.append(line)
+                    self._add_segment_paths(xs[first:], ys[first:], alphas, drawn, QColor(self._qcolor(ball_color)), pen, 95)
                 
                 # Final position - always fully opaque and visible until reached
-                if ball_positions:
-                    final_x, final_y, final_progress, final_frame = ball_positions[-1]
+                if len(frames):
+                    final_x, final_y, final_frame = xs[-1], ys[-1], frames[-1]
                     
                     # Draw while the final position hasn't been reached yet
                     if current_frame is None or current_frame < final_frame:
@@ -261,95 +296,42 @@ class TrajectoryManager:
             return
         
         # Draw simulated player trajectories
+        # Thicker solid lines, above the real trajectories
+        fade_frames = (loop_end - loop_start) if current_frame is not None else 0
+        pen = QPen()
+        pen.setWidthF(CONFIG.TRAJECTORY_PLAYER_LINE_WIDTH * 2)
+        pen.setStyle(Qt.PenStyle.SolidLine)
+        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
         players_data = simulated_data.get('players', {})
         for player_id, positions in players_data.items():
             if len(positions) > 1:
                 # Determine team for color
                 side = "Home" if player_id in self.home_colors else "Away"
                 base_color = self.home_colors.get(player_id, ["#FF0000"])[0] if side == "Home" else self.away_colors.get(player_id, ["#0000FF"])[0]
-                
-                # Draw segments with progressive fading
-                for i in range(len(positions) - 1):
-                    x1, y1, frame1 = positions[i]
-                    x2, y2, frame2 = positions[i + 1]
-                    
-                    # Only draw future segments unless fading is disabled
-                    if 'TRAJECTORY_FADING' in globals() and TRAJECTORY_FADING:
-                        if current_frame is not None and current_frame > frame1:
-                            continue
-                    
-                    # Compute opacity based on temporal distance
-                    color = QColor(base_color)
-                    if 'TRAJECTORY_FADING' in globals() and not TRAJECTORY_FADING:
-                        final_alpha = 1.0
-                    else:
-                        if current_frame is not None:
-                            frames_until_segment = frame1 - current_frame
-                            total_frames = loop_end - loop_start
-                            
-                            if total_frames > 0:
-                                distance_factor = frames_until_segment / total_frames
-                                # Closer -> more opaque
-                                final_alpha = max(0.4, 1.0 - distance_factor * 0.6)
-                            else:
-                                final_alpha = 0.9
-                        else:
-                            final_alpha = 0.9
-                    
-                    color.setAlphaF(final_alpha)
-                    
-                    # Thicker solid line for simulated path
-                    pen = QPen(color, CONFIG.TRAJECTORY_PLAYER_LINE_WIDTH * 2)
-                    pen.setStyle(Qt.PenStyle.SolidLine)
-                    pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-                    
-                    line = self.pitch_widget.scene.addLine(x1, y1, x2, y2, pen)
-                    line.setZValue(15)  # Above real trajectories
-                    self.pitch_widget.dynamic_items.append(line)
+                positions = np.asarray(positions, dtype=float)
+                positions = positions[_first_future_segment(positions[:-1, 2], current_frame):]
+                if len(positions) <= 1:
+                    continue
+                # Progressive fading over the loop: closer -> more opaque
+                alphas, drawn = _segment_alphas(positions[:-1, 2], current_frame, fade_frames, 0.4, 0.6, 0.9)
+                self._add_segment_paths(positions[:, 0], positions[:, 1], alphas, drawn, QColor(self._qcolor(base_color)), pen, 15)
         
         # Draw simulated ball trajectory
         ball_positions = simulated_data.get('ball', [])
         if len(ball_positions) > 1:
-            for i in range(len(ball_positions) - 1):
-                x1, y1, frame1 = ball_positions[i]
-                x2, y2, frame2 = ball_positions[i + 1]
-                
-                # Only draw future segments unless fading is disabled
-                if 'TRAJECTORY_FADING' in globals() and TRAJECTORY_FADING:
-                    if current_frame is not None and current_frame > frame1:
-                        continue
-                
-                # Compute opacity for the ball
-                color = QColor(BALL_COLOR)
-                if 'TRAJECTORY_FADING' in globals() and not TRAJECTORY_FADING:
-                    final_alpha = 1.0
-                else:
-                    if current_frame is not None:
-                        frames_until_segment = frame1 - current_frame
-                        total_frames = loop_end - loop_start
-                        
-                        if total_frames > 0:
-                            distance_factor = frames_until_segment / total_frames
-                            # Closer -> more opaque
-                            final_alpha = max(0.5, 1.0 - distance_factor * 0.5)
-                        else:
-                            final_alpha = 1.0
-                    else:
-                        final_alpha = 1.0
-                
-                color.setAlphaF(final_alpha)
-                
-                # Thicker line for the simulated ball
-                pen = QPen(color, CONFIG.TRAJECTORY_BALL_LINE_WIDTH * 2)
+            ball_positions = np.asarray(ball_positions, dtype=float)
+            future = ball_positions[_first_future_segment(ball_positions[:-1, 2], current_frame):]
+            if len(future) > 1:
+                alphas, drawn = _segment_alphas(future[:-1, 2], current_frame, fade_frames, 0.5, 0.5, 1.0)
+                # Thicker line for the simulated ball, above real ball trajectories
+                pen = QPen()
+                pen.setWidthF(CONFIG.TRAJECTORY_BALL_LINE_WIDTH * 2)
                 pen.setStyle(Qt.PenStyle.SolidLine)
                 pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-                
-                line = self.pitch_widget.scene.addLine(x1, y1, x2, y2, pen)
-                line.setZValue(98)  # Above real ball trajectories
-                self.pitch_widget.dynamic_items.append(line)
+                self._add_segment_paths(future[:, 0], future[:, 1], alphas, drawn, QColor(self._qcolor(BALL_COLOR)), pen, 98)
             
             # Final simulated ball position
-            if ball_positions:
+            if len(ball_positions):
                 final_x, final_y, final_frame = ball_positions[-1]
                 
                 if current_frame is None or current_frame < final_frame:
@@ -366,3 +348,51 @@ class TrajectoryManager:
                     )
                     final_ball.setZValue(99)
                     self.pitch_widget.dynamic_items.append(final_ball)
+
+    def _add_segment_paths(self, xs, ys, alphas, drawn, color, pen, z):
+        """Add trajectory segments as one path item per opacity level.
+
+        Segment opacities are rounded to `TRAJECTORY_ALPHA_LEVELS` steps so a
+        whole track costs a handful of scene items instead of one line item
+        per segment.
+
+        Parameters
+        ----------
+        xs, ys : numpy.ndarray
+            Track vertices; segment i joins vertex i to vertex i + 1.
+        alphas : numpy.ndarray
+            Opacity per segment.
+        drawn : numpy.ndarray
+            Boolean mask of segments to draw.
+        color : QColor
+            Track color (its alpha is overwritten).
+        pen : QPen
+            Pen template, recolored for each level.
+        z : float
+            Z value of the created items.
+        """
+        segments = np.flatnonzero(drawn)
+        if not len(segments):
+            return
+        levels = np.round(alphas[segments] * TRAJECTORY_ALPHA_LEVELS) / TRAJECTORY_ALPHA_LEVELS
+        xs, ys = xs.tolist(), ys.tolist()
+        for level in np.unique(levels).tolist():
+            path = QPainterPath()
+            move_to, line_to = path.moveTo, path.lineTo  # bound once for the vertex loop
+            prev = None
+            for i in segments[levels == level].tolist():
+                # Consecutive segments of a level share their joint vertex
+                if prev != i - 1:
+                    move_to(xs[i], ys[i])
+                line_to(xs[i + 1], ys[i + 1])
+                prev = i
+            color.setAlphaF(level)
+            pen.setColor(color)
+            if self._pool_used == len(self._path_pool):
+                self._path_pool.append(self.pitch_widget.scene.addPath(QPainterPath()))
+            item = self._path_pool[self._pool_used]
+            self._pool_used += 1
+            item.setPath(path)
+            item.setPen(pen)
+            item.setZValue(z)
+            item.setVisible(True)
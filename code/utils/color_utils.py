@@ -12,7 +12,9 @@ These utilities are used by `theme_manager.py` to ensure distinct and
 accessible colors for pitch, lines, offside, and arrows.
 """
 import re
+from functools import lru_cache
 from typing import Tuple
+import numpy as np
 from colormath import color_diff_matrix
 from colormath.color_diff import _get_lab_color1_vector, _get_lab_color2_matrix
 from colormath.color_objects import sRGBColor, LabColor, LCHabColor
@@ -20,6 +22,17 @@ from colormath.color_conversions import convert_color
 
 HEX_RE = re.compile(r'^#?([0-9a-fA-F]{6})$')
 
+# Hex conversions are memoized: theme searches keep converting the same
+# team, pitch and candidate colors
+HEX_CACHE_SIZE = 4096
+
+# Linear-light value of each 8-bit sRGB component (WCAG transfer function)
+SRGB_TO_LINEAR = [
+    c/12.92 if c <= 0.03928 else ((c+0.055)/1.055)**2.4
+    for c in (i/255.0 for i in range(256))
+]
+
+@lru_cache(maxsize=HEX_CACHE_SIZE)
 def hex_to_rgb(hexstr: str) -> Tuple[float, float, float]:
     """Convert a hex color string to normalized RGB tuple.
 
@@ -62,6 +75,35 @@ def relative_luminance(rgb: Tuple[float, float, float]) -> float:
     Rl, Gl, Bl = (lin(c) for c in rgb)
     return 0.2126*Rl + 0.7152*Gl + 0.0722*Bl
 
+def hex_luminance(hexstr: str) -> float:
+    """Compute the WCAG relative luminance of a hex color via a lookup table.
+
+    Equivalent to ``relative_luminance(hex_to_rgb(hexstr))`` without the
+    per-component power function.
+
+    Parameters
+    ----------
+    hexstr : str
+        Hex color string, with or without leading '#'.
+
+    Returns
+    -------
+    float
+        Relative luminance.
+
+    Raises
+    ------
+    ValueError
+        If input is not a valid 6-digit hex color.
+    """
+    m = HEX_RE.match(hexstr)
+    if not m:
+        raise ValueError(f"Invalid hex color: {hexstr}")
+    h = m.group(1)
+    return (0.2126*SRGB_TO_LINEAR[int(h[0:2], 16)]
+            + 0.7152*SRGB_TO_LINEAR[int(h[2:4], 16)]
+            + 0.0722*SRGB_TO_LINEAR[int(h[4:6], 16)])
+
 def contrast_ratio(c1: str, c2: str) -> float:
     """Compute the WCAG contrast ratio between two hex colors.
 
@@ -75,10 +117,11 @@ def contrast_ratio(c1: str, c2: str) -> float:
     float
         Contrast ratio in [1, 21].
     """
-    L1 = relative_luminance(hex_to_rgb(c1))
-    L2 = relative_luminance(hex_to_rgb(c2))
+    L1 = hex_luminance(c1)
+    L2 = hex_luminance(c2)
     return (max(L1, L2) + 0.05) / (min(L1, L2) + 0.05)
 
+@lru_cache(maxsize=HEX_CACHE_SIZE)
 def hex_to_lab(hexstr: str) -> Tuple[float, float, float]:
     """Convert a hex color to CIE Lab.
 
@@ -118,6 +161,29 @@ def delta_e_lab(lab1, lab2) -> float:
             raise ValueError("lab1/lab2 must be LabColor or tuple of (l,a,b)")
     return delta_e_cie2000_patched(to_labcolor(lab1), to_labcolor(lab2))
 
+def delta_e_matrix(labs, ref_labs) -> np.ndarray:
+    """Compute CIEDE2000 ΔE between every pair of two Lab color sets.
+
+    Parameters
+    ----------
+    labs : array-like
+        Lab colors, shape (N, 3).
+    ref_labs : array-like
+        Reference Lab colors, shape (R, 3).
+
+    Returns
+    -------
+    numpy.ndarray
+        ΔE00 values, shape (N, R).
+    """
+    labs = np.asarray(labs, dtype=float).reshape(-1, 3)
+    ref_labs = np.asarray(ref_labs, dtype=float).reshape(-1, 3)
+    out = np.empty((len(labs), len(ref_labs)))
+    # One colormath matrix call per reference covers all candidates at once
+    for j, ref in enumerate(ref_labs):
+        out[:, j] = color_diff_matrix.delta_e_cie2000(ref, labs)
+    return out
+
 def delta_e_cie2000_patched(color1, color2, Kl=1, Kc=1, Kh=1):
     """Patched CIEDE2000 using colormath vectorized internals for speed.
 
@@ -140,6 +206,7 @@ def delta_e_cie2000_patched(color1, color2, Kl=1, Kc=1, Kh=1):
 
     return delta_e.item()
 
+@lru_cache(maxsize=HEX_CACHE_SIZE)
 def hex_to_lch(hexstr: str) -> Tuple[float, float, float]:
     """Convert a hex color to CIE LCHab.
 
@@ -158,6 +225,87 @@ def hex_to_lch(hexstr: str) -> Tuple[float, float, float]:
     lch: LCHabColor = convert_color(lab, LCHabColor)
     return (lch.lch_l, lch.lch_c, lch.lch_h)
 
+def lch_to_lab(lch) -> np.ndarray:
+    """Convert LCHab colors to CIE Lab (polar to Cartesian, no gamut check).
+
+    Parameters
+    ----------
+    lch : array-like
+        (L, C, H) triples, shape (N, 3), H in degrees.
+
+    Returns
+    -------
+    numpy.ndarray
+        (L, a, b) triples, shape (N, 3).
+    """
+    lch = np.asarray(lch, dtype=float).reshape(-1, 3)
+    h = np.radians(lch[:, 2])
+    return np.column_stack([lch[:, 0], lch[:, 1] * np.cos(h), lch[:, 1] * np.sin(h)])
+
+# LCHab colors are in colormath's default D50 white, while sRGB (and so
+# `hex_to_lab`) is D65: Bradford D50->D65 adaptation, then XYZ->linear sRGB
+D50_WHITE = np.array([0.96422, 1.0, 0.82521])
+D65_WHITE = np.array([0.95047, 1.0, 1.08883])
+BRADFORD_D50_TO_D65 = np.array([
+    [0.9555766, -0.0230393, 0.0631636],
+    [-0.0282895, 1.0099416, 0.0210077],
+    [0.0122982, -0.0204830, 1.3299098],
+])
+XYZ_D50_TO_LINEAR_SRGB = np.array([
+    [3.24071, -1.53726, -0.498571],
+    [-0.969258, 1.87599, 0.0415557],
+    [0.0556352, -0.203996, 1.05707],
+]) @ BRADFORD_D50_TO_D65
+
+def _lch_to_xyz_d50(lch) -> np.ndarray:
+    """Convert LCHab colors (D50) to CIE XYZ (D50), shape (N, 3)."""
+    L, a, b = lch_to_lab(lch).T
+    fy = (L + 16.0) / 116.0
+    f = np.column_stack([fy + a / 500.0, fy, fy - b / 200.0])
+    f3 = f ** 3
+    return np.where(f3 > 0.008856, f3, (f - 16.0 / 116.0) / 7.787) * D50_WHITE
+
+def lch_to_lab_d65(lch) -> np.ndarray:
+    """Convert LCHab colors to CIE Lab in the D65 white of `hex_to_lab`.
+
+    Parameters
+    ----------
+    lch : array-like
+        (L, C, H) triples, shape (N, 3), H in degrees.
+
+    Returns
+    -------
+    numpy.ndarray
+        (L, a, b) triples, shape (N, 3), comparable with `hex_to_lab` output.
+    """
+    xyz = _lch_to_xyz_d50(lch) @ BRADFORD_D50_TO_D65.T / D65_WHITE
+    f = np.where(xyz > 0.008856, np.cbrt(xyz), 7.787 * xyz + 16.0 / 116.0)
+    return np.column_stack([
+        116.0 * f[:, 1] - 16.0,
+        500.0 * (f[:, 0] - f[:, 1]),
+        200.0 * (f[:, 1] - f[:, 2]),
+    ])
+
+def lch_in_srgb_gamut(lch, tol: float = 0.01) -> np.ndarray:
+    """Vectorized check that LCHab colors fall inside the sRGB gamut.
+
+    Parameters
+    ----------
+    lch : array-like
+        (L, C, H) triples, shape (N, 3), H in degrees.
+    tol : float, default 0.01
+        Tolerance on gamma-encoded components; keeps borderline colors that
+        `lch_to_hex` may still round into [0, 255].
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean mask, True where every component lies in [-tol, 1 + tol].
+    """
+    rgb = _lch_to_xyz_d50(lch) @ XYZ_D50_TO_LINEAR_SRGB.T
+    rgb = np.where(rgb <= 0.0031308, rgb * 12.92, 1.055 * np.abs(rgb) ** (1 / 2.4) - 0.055)
+    return ((rgb >= -tol) & (rgb <= 1.0 + tol)).all(axis=1)
+
 def lch_to_hex(l: float, c: float, h: float) -> str | None:
     """Convert LCHab to a hex string if in gamut; return None otherwise.
 
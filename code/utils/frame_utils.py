@@ -4,6 +4,7 @@ Frame and possession utilities.
 
 This module provides helpers to:
 - Convert between global frame indices and half-relative indices
+- Group runs of global frames by half without a per-frame lookup
 - Convert between time (minutes/seconds) and frames
 - Compute interval bounds around a given frame
 - Navigate to the next/previous action by frame
@@ -118,14 +119,49 @@ class FrameManager:
         Returns
         - int | None: The target action frame or None if not found.
         """
-        actions_sorted = sorted(actions, key=lambda x: x['frame'])
-        
+        # Only the nearest frame is needed: a linear min/max beats sorting all actions
         if direction > 0:  # Next
-            next_actions = [a for a in actions_sorted if a['frame'] > current_frame]
-            return next_actions[0]['frame'] if next_actions else None
+            return min((a['frame'] for a in actions if a['frame'] > current_frame), default=None)
         else:  # Previous
-            prev_actions = [a for a in actions_sorted if a['frame'] < current_frame]
-            return prev_actions[-1]['frame'] if prev_actions else None
+            return max((a['frame'] for a in actions if a['frame'] < current_frame), default=None)
+
+
+def group_frames_by_half(frames, get_frame_data_func):
+    """Group ascending global frames by half, resolving only the boundaries.
+
+    Within a half, global frames map to consecutive half indices, so each
+    half's run needs one `get_frame_data_func` call for its first frame;
+    where the run ends is found by bisection.
+
+    Parameters
+    ----------
+    frames : array-like of int
+        Global frame indices in ascending order.
+    get_frame_data_func : callable
+        Function mapping global frame -> (half, half_idx, label).
+
+    Returns
+    -------
+    dict[str, tuple[numpy.ndarray, numpy.ndarray]]
+        {half: (positions in `frames`, indices within the half)}.
+    """
+    frames = np.asarray(frames, dtype=int)
+    groups = {}
+    start, n = 0, len(frames)
+    while start < n:
+        half, idx0, _ = get_frame_data_func(int(frames[start]))
+        # Last position still in the same half
+        lo, hi = start, n - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if get_frame_data_func(int(frames[mid]))[0] == half:
+                lo = mid
+            else:
+                hi = mid - 1
+        ks = np.arange(start, lo + 1)
+        groups[half] = (ks, idx0 + (frames[ks] - frames[start]))
+        start = lo + 1
+    return groups
 
 
 class PossessionTracker: